@@ -1,12 +1,21 @@
 """Configuration loader module."""
 
 import os
+import pickle
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Bump when the layout of the cached config data changes
+CONFIG_CACHE_VERSION = 1
+
 
 @dataclass
 class SearchConfig:
@@ -49,6 +58,47 @@ class Config:
     pubmed_api_key: Optional[str] = None
 
 
+def _read_config_data(config_path: Path) -> dict:
+    """Read the parsed YAML data, reusing a pickle sidecar when it is fresh.
+
+    The sidecar is keyed on the config file's mtime and size, so any edit to
+    the YAML invalidates it. Only the parsed YAML is cached; API keys are
+    always read from the environment.
+
+    Args:
+        config_path: Path to config YAML file.
+
+    Returns:
+        Parsed YAML data.
+    """
+    st = os.stat(config_path)
+    key = (CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    cache_path = config_path.with_suffix(".cache.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    # Hand raw bytes to the loader; libyaml detects the encoding itself
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    # Write atomically; a missing cache only costs a re-parse next time
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return data
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file and environment variables.
 
@@ -64,8 +114,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
     else:
         config_path = Path(config_path)
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _read_config_data(config_path)
 
     # Parse journals
     journals_data = data.get("journals", {})
@@ -0,0 +1,123 @@
+"""Persistent cache of sentence embeddings keyed by text content."""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """SQLite-backed cache mapping (text hash, model) to an embedding vector.
+
+    Papers reappear across daily runs (overlapping PubMed windows, preprints
+    that linger), so their embeddings can be reused instead of re-encoded.
+    Vectors are stored as float16 to halve the file size.
+    """
+
+    def __init__(self, cache_path: str | Path, model_name: str):
+        """Open (or create) the cache.
+
+        Args:
+            cache_path: Path to the SQLite database file.
+            model_name: Name of the embedding model; entries of other models
+                are ignored.
+        """
+        self.cache_path = Path(cache_path)
+        self.model_name = model_name
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.cache_path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vec BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (hash, model)
+            )
+            """
+        )
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        """Hash text to a cache key."""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: list[str]) -> list[Optional[np.ndarray]]:
+        """Look up embeddings for several texts.
+
+        Args:
+            texts: Texts to look up.
+
+        Returns:
+            float32 embedding for each text, or None where it is not cached.
+        """
+        hashes = [self._hash(text) for text in texts]
+        found = {}
+
+        # Stay well below SQLite's bound-parameter limit
+        unique = list(dict.fromkeys(hashes))
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT hash, vec FROM embedding_cache "
+                f"WHERE model = ? AND hash IN ({placeholders})",
+                [self.model_name, *chunk],
+            )
+            for key, vec in rows:
+                found[key] = np.frombuffer(vec, dtype=np.float16).astype(np.float32)
+
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE hash = ? AND model = ?",
+                    [(now, key, self.model_name) for key in found],
+                )
+
+        return [found.get(key) for key in hashes]
+
+    def put_many(self, texts: list[str], vectors: np.ndarray):
+        """Store embeddings for several texts.
+
+        Args:
+            texts: Texts that were encoded.
+            vectors: Embeddings, one row per text.
+        """
+        now = time.time()
+        vectors = np.asarray(vectors, dtype=np.float16)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, model, dim, vec, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self._hash(text), self.model_name, vector.shape[0], vector.tobytes(), now)
+                    for text, vector in zip(texts, vectors)
+                ],
+            )
+
+    def cleanup_old(self, days: int = 90):
+        """Remove entries not used in the last N days.
+
+        Args:
+            days: Number of days to keep.
+        """
+        cutoff = time.time() - days * 86400
+        with self.conn:
+            self.conn.execute("DELETE FROM embedding_cache WHERE last_used < ?", (cutoff,))
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
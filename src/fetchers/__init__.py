@@ -1,5 +1,6 @@
 # Paper fetchers module
 from .pubmed import PubMedFetcher
 from .biorxiv import BioRxivFetcher
+from .client import create_shared_client
 
-__all__ = ["PubMedFetcher", "BioRxivFetcher"]
+__all__ = ["PubMedFetcher", "BioRxivFetcher", "create_shared_client"]
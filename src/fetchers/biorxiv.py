@@ -1,11 +1,16 @@
 """bioRxiv and medRxiv fetcher using their public API."""
 
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
 import httpx
 
+from .. import jsonutil
+from .client import create_shared_client
 from .pubmed import Paper
 
 
@@ -14,9 +19,18 @@ class BioRxivFetcher:
 
     BASE_URL = "https://api.biorxiv.org/details"
 
-    def __init__(self):
-        """Initialize bioRxiv fetcher."""
-        self.client = httpx.Client(timeout=30.0)
+    def __init__(self, prefetch_pages: int = 4, client: Optional[httpx.Client] = None):
+        """Initialize bioRxiv fetcher.
+
+        Args:
+            prefetch_pages: Maximum number of result pages requested ahead of
+                the page being parsed.
+            client: Optional HTTP client to share with other fetchers. If None,
+                the fetcher creates (and closes) its own.
+        """
+        self.prefetch_pages = prefetch_pages
+        self._owns_client = client is None
+        self.client = client or create_shared_client()
 
     def fetch_papers(
         self,
@@ -24,6 +38,7 @@ class BioRxivFetcher:
         days_back: int = 1,
         max_results: int = 2000,
         categories: list[str] | None = None,
+        prefilter: Callable[[dict], bool] | None = None,
     ) -> list[Paper]:
         """Fetch recent preprints from bioRxiv or medRxiv.
 
@@ -32,13 +47,15 @@ class BioRxivFetcher:
             days_back: Number of days back to search.
             max_results: Maximum number of results to return.
             categories: List of categories to filter by (None = all categories).
+            prefilter: Optional check on the raw API record; records it rejects
+                are skipped before a Paper is built for them.
 
         Returns:
             List of Paper objects.
         """
-        # Normalize category names for comparison
+        # Normalize category names for comparison (set for O(1) lookups per item)
         if categories:
-            categories_lower = [c.lower() for c in categories]
+            categories_lower = frozenset(c.lower() for c in categories)
         else:
             categories_lower = None
 
@@ -50,23 +67,10 @@ class BioRxivFetcher:
         start_str = start_date.strftime("%Y-%m-%d")
         end_str = end_date.strftime("%Y-%m-%d")
 
-        # API endpoint: /details/{server}/{start_date}/{end_date}/{cursor}
-        url = f"{self.BASE_URL}/{server}/{start_str}/{end_str}/0"
-
         papers = []
-        cursor = 0
-
-        while len(papers) < max_results:
-            url = f"{self.BASE_URL}/{server}/{start_str}/{end_str}/{cursor}"
-            response = self.client.get(url)
-            response.raise_for_status()
-
-            data = response.json()
-            collection = data.get("collection", [])
-
-            if not collection:
-                break
+        pages = self._iter_pages(server, start_str, end_str)
 
+        for collection in pages:
             for item in collection:
                 # Filter by category if specified
                 if categories_lower:
@@ -74,6 +78,9 @@ class BioRxivFetcher:
                     if item_category not in categories_lower:
                         continue
 
+                if prefilter is not None and not prefilter(item):
+                    continue
+
                 paper = self._parse_preprint(item, server)
                 if paper:
                     papers.append(paper)
@@ -81,18 +88,78 @@ class BioRxivFetcher:
                 if len(papers) >= max_results:
                     break
 
-            # Check if there are more results
-            messages = data.get("messages", [{}])
-            if messages:
-                total = int(messages[0].get("total", 0))
-                cursor += len(collection)
-                if cursor >= total:
-                    break
-            else:
+            if len(papers) >= max_results:
+                # Stops the page generator and cancels pages not yet requested
+                pages.close()
                 break
 
         return papers
 
+    def _fetch_page(self, server: str, start_str: str, end_str: str, cursor: int) -> dict:
+        """Fetch one page of results from the details endpoint.
+
+        Args:
+            server: Either "biorxiv" or "medrxiv".
+            start_str: First date of the interval (YYYY-MM-DD).
+            end_str: Last date of the interval (YYYY-MM-DD).
+            cursor: Offset of the first result on the page.
+
+        Returns:
+            Decoded JSON response.
+        """
+        # API endpoint: /details/{server}/{start_date}/{end_date}/{cursor}
+        url = f"{self.BASE_URL}/{server}/{start_str}/{end_str}/{cursor}"
+        response = self.client.get(url)
+        response.raise_for_status()
+        return jsonutil.loads(response.content)
+
+    def _iter_pages(self, server: str, start_str: str, end_str: str) -> Iterator[list[dict]]:
+        """Yield result pages in order, fetching the next ones in the background.
+
+        The first page tells us the total number of results, after which up to
+        prefetch_pages later pages are kept in flight while the caller parses
+        the current one.
+
+        Args:
+            server: Either "biorxiv" or "medrxiv".
+            start_str: First date of the interval (YYYY-MM-DD).
+            end_str: Last date of the interval (YYYY-MM-DD).
+
+        Yields:
+            The "collection" list of each non-empty page.
+        """
+        data = self._fetch_page(server, start_str, end_str, 0)
+        collection = data.get("collection", [])
+        if not collection:
+            return
+        yield collection
+
+        messages = data.get("messages") or [{}]
+        total = int(messages[0].get("total", 0))
+        cursors = iter(range(len(collection), total, len(collection)))
+
+        with ThreadPoolExecutor(max_workers=self.prefetch_pages) as executor:
+            pending = deque(
+                executor.submit(self._fetch_page, server, start_str, end_str, cursor)
+                for _, cursor in zip(range(self.prefetch_pages), cursors)
+            )
+            try:
+                while pending:
+                    data = pending.popleft().result()
+                    cursor = next(cursors, None)
+                    if cursor is not None:
+                        pending.append(
+                            executor.submit(self._fetch_page, server, start_str, end_str, cursor)
+                        )
+
+                    collection = data.get("collection", [])
+                    if not collection:
+                        return
+                    yield collection
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def _parse_preprint(self, item: dict, server: str) -> Optional[Paper]:
         """Parse a single preprint from API response.
 
@@ -137,6 +204,7 @@ class BioRxivFetcher:
         days_back: int = 1,
         max_results_per_server: int = 2000,
         categories_by_server: dict[str, list[str]] | None = None,
+        prefilter: Callable[[dict], bool] | None = None,
     ) -> list[Paper]:
         """Fetch preprints from multiple servers.
 
@@ -145,6 +213,7 @@ class BioRxivFetcher:
             days_back: Number of days back to search.
             max_results_per_server: Maximum results per server.
             categories_by_server: Dict mapping server name to list of categories.
+            prefilter: Optional check on the raw API record (see fetch_papers).
 
         Returns:
             Combined list of Paper objects.
@@ -163,14 +232,16 @@ class BioRxivFetcher:
                     days_back=days_back,
                     max_results=max_results_per_server,
                     categories=server_categories,
+                    prefilter=prefilter,
                 )
                 all_papers.extend(papers)
 
         return all_papers
 
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client if this fetcher created it."""
+        if self._owns_client:
+            self.client.close()
 
     def __enter__(self):
         return self
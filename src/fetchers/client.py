@@ -0,0 +1,20 @@
+"""HTTP client shared by the paper fetchers."""
+
+import httpx
+
+
+def create_shared_client() -> httpx.Client:
+    """Create an HTTP client that several fetchers can share.
+
+    Passing one client to every fetcher lets them share a connection pool
+    (and HTTP/2 connections where hosts overlap) instead of each paying for
+    its own TLS handshakes.
+
+    Returns:
+        httpx.Client configured for the fetchers. The caller closes it.
+    """
+    return httpx.Client(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
@@ -1,15 +1,20 @@
 """PubMed fetcher using NCBI E-utilities API."""
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional
 from xml.etree import ElementTree as ET
 
 import httpx
 
+from .. import jsonutil
+from .client import create_shared_client
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
     """Represents a research paper."""
     pmid: str
@@ -28,6 +33,35 @@ class Paper:
             return f"https://doi.org/{self.doi}"
         return f"https://pubmed.ncbi.nlm.nih.gov/{self.pmid}/"
 
+    @property
+    def author_head(self) -> str:
+        """Return the first five authors, with "..." if there are more."""
+        head = ", ".join(self.authors[:5])
+        return head + "..." if len(self.authors) > 5 else head
+
+
+class _RateLimiter:
+    """Space out request start times across threads."""
+
+    def __init__(self, requests_per_second: float):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_second: Maximum number of requests started per second.
+        """
+        self.interval = 1.0 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request is allowed to start."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class PubMedFetcher:
     """Fetcher for PubMed papers using E-utilities API."""
@@ -36,25 +70,65 @@ class PubMedFetcher:
     SEARCH_URL = f"{BASE_URL}/esearch.fcgi"
     FETCH_URL = f"{BASE_URL}/efetch.fcgi"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # NCBI allows 3 requests/second without an API key and 10 with one
+    RATE_LIMIT = 3
+    RATE_LIMIT_WITH_KEY = 10
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_workers: int = 3,
+        client: Optional[httpx.Client] = None,
+    ):
         """Initialize PubMed fetcher.
 
         Args:
             api_key: Optional NCBI API key for higher rate limits.
+            max_workers: Maximum number of efetch batches in flight at once.
+            client: Optional HTTP client to share with other fetchers. If None,
+                the fetcher creates (and closes) its own.
         """
         self.api_key = api_key
-        self.client = httpx.Client(timeout=30.0)
+        self.max_workers = max_workers
+        self._owns_client = client is None
+        self.client = client or create_shared_client()
+        self._rate_limiter = _RateLimiter(
+            self.RATE_LIMIT_WITH_KEY if api_key else self.RATE_LIMIT
+        )
+
+    @staticmethod
+    def _date_window(days_back: int) -> tuple[str, str]:
+        """Compute the publication date window as PubMed date strings.
+
+        Args:
+            days_back: Number of days back to search.
+
+        Returns:
+            Tuple of (start, end) dates formatted as YYYY/MM/DD.
+        """
+        # Target: days_back days before today, excluding today
+        today = date.today()
+        end_date = today - timedelta(days=1)  # Yesterday
+        start_date = today - timedelta(days=days_back)  # days_back days ago
+
+        # Plain field formatting skips strftime's format parsing and locale lookup
+        return (
+            f"{start_date.year:04d}/{start_date.month:02d}/{start_date.day:02d}",
+            f"{end_date.year:04d}/{end_date.month:02d}/{end_date.day:02d}",
+        )
 
     def _build_search_query(
         self,
         journals: list[str],
-        days_back: int = 1,
+        start_date: str,
+        end_date: str,
     ) -> str:
         """Build PubMed search query.
 
         Args:
             journals: List of journal names to search.
-            days_back: Number of days back to search.
+            start_date: First publication date (YYYY/MM/DD).
+            end_date: Last publication date (YYYY/MM/DD).
 
         Returns:
             PubMed query string.
@@ -66,11 +140,8 @@ class PubMedFetcher:
 
         journal_filter = " OR ".join(journal_queries)
 
-        # Build date filter (target: days_back days before today, excluding today)
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = today - timedelta(days=1)  # Yesterday
-        start_date = today - timedelta(days=days_back)  # days_back days ago
-        date_filter = f'("{start_date.strftime("%Y/%m/%d")}"[Date - Publication] : "{end_date.strftime("%Y/%m/%d")}"[Date - Publication])'
+        # Build date filter
+        date_filter = f'("{start_date}"[Date - Publication] : "{end_date}"[Date - Publication])'
 
         # Combine filters
         query = f"({journal_filter}) AND {date_filter}"
@@ -92,7 +163,8 @@ class PubMedFetcher:
         Returns:
             List of PubMed IDs (PMIDs).
         """
-        query = self._build_search_query(journals, days_back)
+        start_date, end_date = self._date_window(days_back)
+        query = self._build_search_query(journals, start_date, end_date)
 
         params = {
             "db": "pubmed",
@@ -105,10 +177,11 @@ class PubMedFetcher:
         if self.api_key:
             params["api_key"] = self.api_key
 
+        self._rate_limiter.wait()
         response = self.client.get(self.SEARCH_URL, params=params)
         response.raise_for_status()
 
-        data = response.json()
+        data = jsonutil.loads(response.content)
         pmids = data.get("esearchresult", {}).get("idlist", [])
         return pmids
 
@@ -125,32 +198,53 @@ class PubMedFetcher:
         if not pmids:
             return []
 
+        # Process PMIDs in batches to avoid URL length limits
+        batches = [pmids[i : i + batch_size] for i in range(0, len(pmids), batch_size)]
+
+        if len(batches) == 1:
+            return self._fetch_batch(batches[0])
+
+        # Batches are network-bound, so overlap them; the rate limiter keeps
+        # request starts within NCBI's limit
         all_papers = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for papers in executor.map(self._fetch_batch, batches):
+                all_papers.extend(papers)
 
-        # Process PMIDs in batches to avoid URL length limits
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i : i + batch_size]
+        return all_papers
 
-            params = {
-                "db": "pubmed",
-                "id": ",".join(batch),
-                "retmode": "xml",
-            }
+    def _fetch_batch(self, pmids: list[str]) -> list[Paper]:
+        """Fetch and parse a single efetch batch.
 
-            if self.api_key:
-                params["api_key"] = self.api_key
+        Args:
+            pmids: PubMed IDs to fetch in one request.
 
-            response = self.client.get(self.FETCH_URL, params=params)
-            response.raise_for_status()
+        Returns:
+            List of Paper objects.
+        """
+        params = {
+            "db": "pubmed",
+            "id": ",".join(pmids),
+            "retmode": "xml",
+        }
 
-            papers = self._parse_xml_response(response.text)
-            all_papers.extend(papers)
+        if self.api_key:
+            params["api_key"] = self.api_key
 
-            # Rate limiting between batches
-            if not self.api_key and i + batch_size < len(pmids):
-                time.sleep(0.34)
+        self._rate_limiter.wait()
 
-        return all_papers
+        # Parse articles as the body arrives instead of after the download
+        papers = []
+        parser = ET.XMLPullParser(events=("end",))
+        with self.client.stream("GET", self.FETCH_URL, params=params) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+                papers.extend(self._read_articles(parser))
+        parser.close()
+        papers.extend(self._read_articles(parser))
+
+        return papers
 
     def _parse_xml_response(self, xml_text: str) -> list[Paper]:
         """Parse PubMed XML response.
@@ -158,21 +252,37 @@ class PubMedFetcher:
         Args:
             xml_text: XML response from PubMed.
 
+        Returns:
+            List of Paper objects.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        parser.feed(xml_text)
+        parser.close()
+        return self._read_articles(parser)
+
+    def _read_articles(self, parser: ET.XMLPullParser) -> list[Paper]:
+        """Parse the articles completed so far in a pull parser.
+
+        Args:
+            parser: Pull parser fed with (part of) a PubMed XML response.
+
         Returns:
             List of Paper objects.
         """
         papers = []
-        root = ET.fromstring(xml_text)
 
-        for article in root.findall(".//PubmedArticle"):
+        for _, element in parser.read_events():
+            if element.tag != "PubmedArticle":
+                continue
             try:
-                paper = self._parse_article(article)
+                paper = self._parse_article(element)
                 if paper:
                     papers.append(paper)
             except Exception as e:
                 # Log error but continue processing other articles
                 print(f"Error parsing article: {e}")
-                continue
+            # Drop the parsed subtree so memory stays flat on big batches
+            element.clear()
 
         return papers
 
@@ -185,44 +295,34 @@ class PubMedFetcher:
         Returns:
             Paper object or None if parsing fails.
         """
-        medline = article.find(".//MedlineCitation")
+        medline = article.find("MedlineCitation")
         if medline is None:
             return None
 
         # Get PMID
-        pmid_elem = medline.find(".//PMID")
+        pmid_elem = medline.find("PMID")
         pmid = pmid_elem.text if pmid_elem is not None else ""
 
         # Get article info
-        article_elem = medline.find(".//Article")
+        article_elem = medline.find("Article")
         if article_elem is None:
             return None
 
         # Get title
-        title_elem = article_elem.find(".//ArticleTitle")
+        title_elem = article_elem.find("ArticleTitle")
         title = title_elem.text if title_elem is not None else ""
 
-        # Get abstract
-        abstract_elem = article_elem.find(".//Abstract/AbstractText")
-        abstract = ""
-        if abstract_elem is not None:
-            # Handle structured abstracts
-            abstract_parts = article_elem.findall(".//Abstract/AbstractText")
-            abstract_texts = []
-            for part in abstract_parts:
-                label = part.get("Label", "")
-                text = part.text or ""
-                if label:
-                    abstract_texts.append(f"{label}: {text}")
-                else:
-                    abstract_texts.append(text)
-            abstract = " ".join(abstract_texts)
+        # Get abstract (structured abstracts have one labelled part per section)
+        abstract = " ".join(
+            f"{part.get('Label')}: {part.text or ''}" if part.get("Label") else (part.text or "")
+            for part in article_elem.iterfind("Abstract/AbstractText")
+        )
 
         # Get authors
         authors = []
-        author_list = article_elem.find(".//AuthorList")
+        author_list = article_elem.find("AuthorList")
         if author_list is not None:
-            for author in author_list.findall(".//Author"):
+            for author in author_list.iterfind("Author"):
                 lastname = author.find("LastName")
                 forename = author.find("ForeName")
                 if lastname is not None and forename is not None:
@@ -231,11 +331,11 @@ class PubMedFetcher:
                     authors.append(lastname.text)
 
         # Get journal
-        journal_elem = article_elem.find(".//Journal/Title")
+        journal_elem = article_elem.find("Journal/Title")
         journal = journal_elem.text if journal_elem is not None else ""
 
         # Get publication date
-        pub_date_elem = article_elem.find(".//Journal/JournalIssue/PubDate")
+        pub_date_elem = article_elem.find("Journal/JournalIssue/PubDate")
         pub_date = ""
         if pub_date_elem is not None:
             year = pub_date_elem.find("Year")
@@ -252,9 +352,9 @@ class PubMedFetcher:
 
         # Get DOI
         doi = None
-        article_id_list = article.find(".//PubmedData/ArticleIdList")
+        article_id_list = article.find("PubmedData/ArticleIdList")
         if article_id_list is not None:
-            for article_id in article_id_list.findall("ArticleId"):
+            for article_id in article_id_list.iterfind("ArticleId"):
                 if article_id.get("IdType") == "doi":
                     doi = article_id.text
                     break
@@ -291,15 +391,12 @@ class PubMedFetcher:
         if not pmids:
             return []
 
-        # Rate limiting: wait 0.34s between requests (3 requests/second without API key)
-        if not self.api_key:
-            time.sleep(0.34)
-
         return self.fetch_details(pmids)
 
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client if this fetcher created it."""
+        if self._owns_client:
+            self.client.close()
 
     def __enter__(self):
         return self
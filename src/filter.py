@@ -1,13 +1,24 @@
 """Paper filtering module based on keywords and authors."""
 
 import re
+import string
+from bisect import bisect_right
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import ahocorasick
+except ImportError:  # optional, see the "fast" extra
+    ahocorasick = None
 
 from .fetchers.pubmed import Paper
 from .config import KeywordsConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterResult:
     """Result of filtering a paper."""
     paper: Paper
@@ -30,6 +41,367 @@ class FilterResult:
         return "; ".join(reasons)
 
 
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if char counts as a word character for regex \\b."""
+    return char.isalnum() or char == "_"
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    """Check if char counts as a word character for regex \\b with re.ASCII."""
+    return char in _ASCII_WORD_CHARS
+
+
+def _lower_with_offsets(text: str) -> tuple[str, Optional[list[int]]]:
+    """Lowercase text, keeping track of where each character came from.
+
+    A few characters lowercase to more than one character (e.g. "İ"), which
+    shifts every later offset.
+
+    Args:
+        text: Text to lowercase.
+
+    Returns:
+        Tuple of (lowercased text, offset in text of each lowercased
+        character, or None if the offsets are unchanged).
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered, None
+    return lowered, [i for i, char in enumerate(text) for _ in char.lower()]
+
+
+def _at_word_boundary(text: str, pos: int, is_word_char=_is_word_char) -> bool:
+    """Check if there is a word boundary (as in regex \\b) at text[pos]."""
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
+
+
+class _AlternationMatcher:
+    """Find which of many keywords occur in a text with a single regex scan."""
+
+    def __init__(self, keywords: list[str]):
+        """Build the combined pattern.
+
+        Args:
+            keywords: Keywords to look for (matched case-insensitively on word boundaries).
+        """
+        # Longest first, so that of several keywords starting at the same
+        # position the alternation reports the longest one
+        self.keywords = sorted(set(keywords), key=len, reverse=True)
+
+        # A shorter keyword can only match where a longer one already did if
+        # it is a prefix of it; those are re-checked at the reported position
+        lowered = [keyword.lower() for keyword in self.keywords]
+        self._prefix_keywords = [
+            [j for j in range(i + 1, len(lowered)) if lowered[i].startswith(lowered[j])]
+            for i in range(len(lowered))
+        ]
+
+        # ASCII texts are scanned with re.ASCII, which makes every \b check a
+        # cheap table lookup; on ASCII text both variants agree
+        self._ascii = self._compile(re.IGNORECASE | re.ASCII)
+        self._unicode = self._compile(re.IGNORECASE)
+
+    def _compile(self, flags: int) -> tuple[Optional[re.Pattern], list[re.Pattern]]:
+        """Compile the combined and per-keyword patterns.
+
+        Args:
+            flags: Regex flags to compile with.
+
+        Returns:
+            Tuple of (combined pattern or None if there are no keywords,
+            per-keyword patterns).
+        """
+        patterns = [
+            re.compile(rf"\b{re.escape(keyword)}\b", flags)
+            for keyword in self.keywords
+        ]
+
+        # Each alternative is wrapped in a lookahead so matches do not consume
+        # text and overlapping keywords are all found
+        regex = re.compile(
+            "|".join(
+                rf"(?=(?P<k{i}>\b{re.escape(keyword)}\b))"
+                for i, keyword in enumerate(self.keywords)
+            ),
+            flags,
+        ) if self.keywords else None
+        return regex, patterns
+
+    def search(self, text: str) -> set[str]:
+        """Return the keywords found in text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Set of matched keywords.
+        """
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield every keyword occurrence in text.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Tuples of (start offset, matched keyword).
+        """
+        regex, patterns = self._ascii if text.isascii() else self._unicode
+        if regex is None:
+            return
+
+        for match in regex.finditer(text):
+            start = match.start()
+            i = int(match.lastgroup[1:])
+            yield start, self.keywords[i]
+            for j in self._prefix_keywords[i]:
+                if patterns[j].match(text, start):
+                    yield start, self.keywords[j]
+
+
+class _AhoCorasickMatcher:
+    """Find which of many keywords occur in a text with an Aho-Corasick automaton."""
+
+    def __init__(self, keywords: list[str]):
+        """Build the automaton.
+
+        Args:
+            keywords: Keywords to look for (matched case-insensitively on word boundaries).
+        """
+        self.keywords = keywords
+        self._automaton = ahocorasick.Automaton()
+        for keyword in set(keywords):
+            lowered = keyword.lower()
+            if not lowered:
+                continue
+            if lowered in self._automaton:
+                self._automaton.get(lowered)[1].append(keyword)
+            else:
+                self._automaton.add_word(lowered, (len(lowered), [keyword]))
+        self._empty = len(self._automaton) == 0
+        if not self._empty:
+            self._automaton.make_automaton()
+
+    def search(self, text: str) -> set[str]:
+        """Return the keywords found in text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Set of matched keywords.
+        """
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield every keyword occurrence in text.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Tuples of (start offset, matched keyword).
+        """
+        if self._empty:
+            return
+
+        text, origins = _lower_with_offsets(text)
+        is_word_char = _is_ascii_word_char if text.isascii() else _is_word_char
+        for end, (length, keywords) in self._automaton.iter(text):
+            start = end - length + 1
+            if (
+                _at_word_boundary(text, start, is_word_char)
+                and _at_word_boundary(text, end + 1, is_word_char)
+            ):
+                for keyword in keywords:
+                    yield start if origins is None else origins[start], keyword
+
+
+def _find_word(text: str, probe: str, start: int = 0, is_word_char=_is_word_char) -> int:
+    """Find the next occurrence of probe in text that sits on word boundaries.
+
+    Args:
+        text: Text to search (already lowercased).
+        probe: Lowercased keyword.
+        start: Offset to start searching from.
+        is_word_char: Word character predicate for the boundary check.
+
+    Returns:
+        Start offset of the occurrence, or -1 if there is none.
+    """
+    start = text.find(probe, start)
+    while start != -1:
+        # Only hits need the (comparatively slow) boundary check
+        if (
+            _at_word_boundary(text, start, is_word_char)
+            and _at_word_boundary(text, start + len(probe), is_word_char)
+        ):
+            return start
+        start = text.find(probe, start + 1)
+    return -1
+
+
+class _FindMatcher:
+    """Find which of a few keywords occur in a text using str.find."""
+
+    def __init__(self, keywords: list[str]):
+        """Lowercase the keywords once and generate the search function.
+
+        Args:
+            keywords: Keywords to look for (matched case-insensitively on word boundaries).
+        """
+        self.keywords = keywords
+        probes: dict[str, list[str]] = {}
+        for keyword in set(keywords):
+            if keyword:
+                probes.setdefault(keyword.lower(), []).append(keyword)
+        self._probes = list(probes.items())
+        self.search = self._compile_search()
+
+    def _compile_search(self):
+        """Generate a search function specialized to this matcher's keywords.
+
+        The keyword set is fixed once the matcher is built, so each probe is
+        written into the function as a literal ``in`` test; the hot path has no
+        loop over probes and no attribute lookups.
+
+        Returns:
+            Function taking a text and returning the set of matched keywords.
+        """
+        lines = [
+            "def search(text):",
+            "    text = text.lower()",
+            "    is_word_char = is_ascii_word_char if text.isascii() else is_unicode_word_char",
+            "    found = set()",
+        ]
+        for probe, keywords in self._probes:
+            lines.append(
+                f"    if {probe!r} in text and find_word(text, {probe!r}, 0, is_word_char) != -1:"
+            )
+            lines.append(f"        found.update({tuple(keywords)!r})")
+        lines.append("    return found")
+
+        namespace = {
+            "find_word": _find_word,
+            "is_ascii_word_char": _is_ascii_word_char,
+            "is_unicode_word_char": _is_word_char,
+        }
+        exec("\n".join(lines), namespace)
+        search = namespace["search"]
+        search.__doc__ = "Return the keywords found in text."
+        return search
+
+    def __getstate__(self) -> dict:
+        # Generated functions cannot be pickled; rebuild after unpickling
+        state = self.__dict__.copy()
+        del state["search"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.search = self._compile_search()
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield every keyword occurrence in text.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            Tuples of (start offset, matched keyword).
+        """
+        text, origins = _lower_with_offsets(text)
+        is_word_char = _is_ascii_word_char if text.isascii() else _is_word_char
+        for probe, keywords in self._probes:
+            start = _find_word(text, probe, 0, is_word_char)
+            while start != -1:
+                for keyword in keywords:
+                    yield start if origins is None else origins[start], keyword
+                start = _find_word(text, probe, start + 1, is_word_char)
+
+
+# Up to this many keywords, one C-level str.find per keyword beats building
+# and running an automaton or a combined regex
+_FIND_MATCHER_MAX_KEYWORDS = 16
+
+
+def _build_matcher(keywords: list[str]):
+    """Create the fastest available keyword matcher for the list size.
+
+    Word boundaries follow full Unicode rules; ASCII texts (most titles and
+    abstracts) take a cheaper ASCII-only check that gives the same result.
+
+    Args:
+        keywords: Keywords to look for.
+
+    Returns:
+        Matcher with search(text) returning the matched keywords and
+        iter_matches(text) yielding (offset, keyword) for every occurrence.
+    """
+    if len(keywords) <= _FIND_MATCHER_MAX_KEYWORDS:
+        return _FindMatcher(keywords)
+    if ahocorasick is not None:
+        return _AhoCorasickMatcher(keywords)
+    return _AlternationMatcher(keywords)
+
+
+@dataclass(slots=True)
+class PaperBatch:
+    """Papers laid out as parallel lists of the fields the filter reads."""
+    papers: list[Paper]
+    titles: list[str]
+    abstracts: list[str]
+    authors_joined: list[str]
+
+    @classmethod
+    def from_papers(cls, papers: list[Paper]) -> "PaperBatch":
+        """Build a batch from a list of papers.
+
+        Args:
+            papers: Papers to include.
+
+        Returns:
+            PaperBatch over the given papers.
+        """
+        return cls(
+            papers=papers,
+            titles=[paper.title for paper in papers],
+            abstracts=[paper.abstract for paper in papers],
+            authors_joined=[" ".join(paper.authors) for paper in papers],
+        )
+
+
+# Separates papers when a batch is scanned as one string; it is not a word
+# character, so keywords cannot match across it
+_BATCH_SEPARATOR = "\x1f"
+
+
+def _join_texts(texts: list[str]) -> tuple[str, list[int]]:
+    """Join texts, recording where each one starts.
+
+    Case is left alone: each matcher normalizes it the same way for a joined
+    text as for a single one.
+
+    Args:
+        texts: Texts to join.
+
+    Returns:
+        Tuple of (joined text, start offset of each text).
+    """
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + len(_BATCH_SEPARATOR)
+    return _BATCH_SEPARATOR.join(texts), starts
+
+
 class PaperFilter:
     """Filter papers based on keywords and authors."""
 
@@ -42,27 +414,22 @@ class PaperFilter:
         self.topics = keywords.topics
         self.authors = keywords.authors
 
-        # Pre-compile topic patterns (case-insensitive)
-        self.topic_patterns = [
-            re.compile(rf"\b{re.escape(topic)}\b", re.IGNORECASE)
-            for topic in self.topics
-        ]
+        # Topic matcher (case-insensitive)
+        self._topic_matcher = _build_matcher(self.topics)
+        self._distinct_topic_count = len(set(self.topics))
 
-        # Pre-compile author patterns (case-insensitive)
-        # Match full name or last name
-        self.author_patterns = []
-        for author in self.authors:
-            # Full name match
-            self.author_patterns.append(
-                (author, re.compile(rf"\b{re.escape(author)}\b", re.IGNORECASE))
-            )
-            # Last name match (assume last word is surname)
+        # Author matcher (case-insensitive)
+        # Match full name or last name (assume last word is surname); authors
+        # sharing a last name share one probe
+        self._author_probes: dict[str, list[str]] = {}
+        for author in dict.fromkeys(self.authors):
             parts = author.split()
-            if len(parts) > 1:
-                lastname = parts[-1]
-                self.author_patterns.append(
-                    (author, re.compile(rf"\b{re.escape(lastname)}\b", re.IGNORECASE))
-                )
+            probes = {author.lower(), parts[-1].lower()} if parts else {author.lower()}
+            for probe in probes:
+                self._author_probes.setdefault(probe, []).append(author)
+        # Author lists are short, so plain str.find probes beat an automaton
+        # or regex even for long author lists
+        self._author_matcher = _FindMatcher(list(self._author_probes))
 
     def filter_paper(self, paper: Paper) -> FilterResult:
         """Filter a single paper.
@@ -73,25 +440,22 @@ class PaperFilter:
         Returns:
             FilterResult with match information.
         """
-        matched_topics = []
-        matched_authors = []
-
-        # Check topics in title and abstract
-        searchable_text = f"{paper.title} {paper.abstract}"
-
-        for topic, pattern in zip(self.topics, self.topic_patterns):
-            if pattern.search(searchable_text):
-                matched_topics.append(topic)
+        # Check topics in title and abstract; scan them separately rather than
+        # copying both into one string, and skip the abstract if the title
+        # already matched every topic
+        found_topics = self._topic_matcher.search(paper.title)
+        if len(found_topics) < self._distinct_topic_count:
+            found_topics |= self._topic_matcher.search(paper.abstract)
+        matched_topics = [topic for topic in self.topics if topic in found_topics]
 
         # Check authors
         authors_text = " ".join(paper.authors)
         matched_author_names = set()
-
-        for author_name, pattern in self.author_patterns:
-            if pattern.search(authors_text):
-                matched_author_names.add(author_name)
-
-        matched_authors = list(matched_author_names)
+        for probe in self._author_matcher.search(authors_text):
+            matched_author_names.update(self._author_probes[probe])
+        matched_authors = [
+            author for author in dict.fromkeys(self.authors) if author in matched_author_names
+        ]
 
         return FilterResult(
             paper=paper,
@@ -99,32 +463,132 @@ class PaperFilter:
             matched_authors=matched_authors,
         )
 
-    def filter_papers(self, papers: list[Paper]) -> list[FilterResult]:
-        """Filter multiple papers.
+    def prefilter(self, record: dict) -> bool:
+        """Check whether a raw bioRxiv/medRxiv API record would match.
+
+        Meant as the prefilter of BioRxivFetcher.fetch_papers, so records that
+        cannot match are dropped before a Paper is built for them. Gives the
+        same answer as filter_paper(...).is_matched on the parsed paper.
 
         Args:
-            papers: List of papers to filter.
+            record: Item from the "collection" list of the details endpoint.
+
+        Returns:
+            True if the record matches any topic or author.
+        """
+        return bool(
+            self._topic_matcher.search(record.get("title", ""))
+            or self._topic_matcher.search(record.get("abstract", ""))
+            or self._author_matcher.search(record.get("authors", ""))
+        )
+
+    def filter_batch(self, batch: PaperBatch) -> list[FilterResult]:
+        """Filter a batch of papers with one scan per field.
+
+        All titles are joined into a single string and scanned once, as are
+        all abstracts and all author lists; match offsets are mapped back to
+        papers.
+
+        Args:
+            batch: Batch of papers to filter.
 
         Returns:
             List of FilterResults for papers that matched.
         """
+        found_topics = [set() for _ in batch.papers]
+        for texts in (batch.titles, batch.abstracts):
+            topic_text, topic_starts = _join_texts(texts)
+            for offset, topic in self._topic_matcher.iter_matches(topic_text):
+                found_topics[bisect_right(topic_starts, offset) - 1].add(topic)
+
+        found_probes = [set() for _ in batch.papers]
+        authors_text, author_starts = _join_texts(batch.authors_joined)
+        for offset, probe in self._author_matcher.iter_matches(authors_text):
+            found_probes[bisect_right(author_starts, offset) - 1].add(probe)
+
         results = []
-        for paper in papers:
-            result = self.filter_paper(paper)
-            if result.is_matched:
-                results.append(result)
+        for paper, topics, probes in zip(batch.papers, found_topics, found_probes):
+            if not topics and not probes:
+                continue
+            matched_author_names = set()
+            for probe in probes:
+                matched_author_names.update(self._author_probes[probe])
+            results.append(
+                FilterResult(
+                    paper=paper,
+                    matched_topics=[topic for topic in self.topics if topic in topics],
+                    matched_authors=[
+                        author
+                        for author in dict.fromkeys(self.authors)
+                        if author in matched_author_names
+                    ],
+                )
+            )
         return results
 
+    def filter_papers(self, papers: list[Paper], max_workers: int = 1) -> list[FilterResult]:
+        """Filter multiple papers.
+
+        Args:
+            papers: List of papers to filter.
+            max_workers: Number of worker processes. With 1, papers are filtered
+                in the current process.
+
+        Returns:
+            List of FilterResults for papers that matched.
+        """
+        if max_workers > 1 and len(papers) > 1:
+            # Large chunks keep pickling the filter and papers from dominating
+            chunksize = max(1, len(papers) // (4 * max_workers))
+            chunks = [papers[i : i + chunksize] for i in range(0, len(papers), chunksize)]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = []
+                for chunk_results in executor.map(self._filter_chunk, chunks):
+                    results.extend(chunk_results)
+                return results
+
+        return self._filter_chunk(papers)
+
+    def _filter_chunk(self, papers: list[Paper]) -> list[FilterResult]:
+        """Filter a list of papers as one batch.
+
+        Args:
+            papers: Papers to filter.
+
+        Returns:
+            List of FilterResults for papers that matched.
+        """
+        return self.filter_batch(PaperBatch.from_papers(papers))
+
+
+@lru_cache(maxsize=8)
+def _get_filter(topics: tuple[str, ...], authors: tuple[str, ...]) -> PaperFilter:
+    """Build a PaperFilter, reusing one already built for the same keywords.
+
+    Args:
+        topics: Topic keywords.
+        authors: Author names.
+
+    Returns:
+        PaperFilter for the given keywords.
+    """
+    return PaperFilter(KeywordsConfig(topics=list(topics), authors=list(authors)))
+
 
-def filter_papers_by_keywords(papers: list[Paper], keywords: KeywordsConfig) -> list[FilterResult]:
+def filter_papers_by_keywords(
+    papers: list[Paper],
+    keywords: KeywordsConfig,
+    max_workers: int = 1,
+) -> list[FilterResult]:
     """Convenience function to filter papers.
 
     Args:
         papers: List of papers to filter.
         keywords: Keywords configuration.
+        max_workers: Number of worker processes to filter with.
 
     Returns:
         List of FilterResults for papers that matched.
     """
-    paper_filter = PaperFilter(keywords)
-    return paper_filter.filter_papers(papers)
+    paper_filter = _get_filter(tuple(keywords.topics), tuple(keywords.authors))
+    return paper_filter.filter_papers(papers, max_workers=max_workers)
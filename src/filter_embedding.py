@@ -1,14 +1,48 @@
 """Paper filtering module using sentence embeddings for semantic search."""
 
+import os
+import re
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # optional, see the "fast" extra
+    simsimd = None
 
 from .fetchers.pubmed import Paper
 from .config import KeywordsConfig
+from .embedding_cache import EmbeddingCache
+
+# torch and sentence-transformers take seconds to import, so they are imported
+# where first needed rather than whenever this module is loaded
+if TYPE_CHECKING:
+    import torch
+
+
+class _StripCombiningMarks(dict):
+    """str.translate table deleting combining marks (category Mn).
+
+    Entries are filled in on first lookup, so the table only ever holds the
+    characters actually seen.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = None if unicodedata.category(chr(codepoint)) == "Mn" else codepoint
+        self[codepoint] = value
+        return value
 
 
+_STRIP_COMBINING_MARKS = _StripCombiningMarks()
+
+
+# Author names repeat across papers (co-authors, search authors), so both
+# name helpers are memoized
+@lru_cache(maxsize=8192)
 def normalize_to_ascii(text: str) -> str:
     """Normalize text by removing diacritics (accents).
 
@@ -16,17 +50,67 @@ def normalize_to_ascii(text: str) -> str:
         "Müller" -> "Muller"
         "José García" -> "Jose Garcia"
     """
+    # ASCII text has no diacritics
+    if text.isascii():
+        return text
     # NFD: 分解形式に変換（ü → u + ¨）
     normalized = unicodedata.normalize("NFD", text)
     # 結合文字（アクセント記号）を除去
-    ascii_text = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-    return ascii_text
+    return normalized.translate(_STRIP_COMBINING_MARKS)
+
+
+def quantize_int8(embeddings: np.ndarray) -> np.ndarray:
+    """Quantize embeddings to int8 with a per-vector absmax scale.
+
+    Cosine similarity ignores vector length, so each row is scaled to use
+    the full int8 range without storing the scale.
+    """
+    scale = np.abs(embeddings).max(axis=1, keepdims=True)
+    scale[scale == 0] = 1.0
+    return np.round(embeddings / scale * 127).astype(np.int8)
+
+
+def select_device(device: Optional[str] = None) -> str:
+    """Pick the torch device used to run the embedding model.
+
+    Args:
+        device: Explicit device (e.g. "cuda", "mps", "cpu"). If None, the
+            EMBEDDING_DEVICE environment variable is used, and failing that
+            the first available of cuda, mps and cpu.
+
+    Returns:
+        Device name.
+    """
+    device = device or os.environ.get("EMBEDDING_DEVICE")
+    if device:
+        return device
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def default_num_threads() -> int:
+    """Number of CPU threads for torch, from EMBEDDING_THREADS or half the cores.
+
+    Torch defaults to one thread per logical core, which oversubscribes
+    hyperthreaded CPUs and slows encoding down.
+    """
+    threads = os.environ.get("EMBEDDING_THREADS")
+    if threads:
+        return int(threads)
+    return max(1, (os.cpu_count() or 2) // 2)
 
 
 # Name suffixes to ignore when extracting last name
 NAME_SUFFIXES = {"jr", "jr.", "sr", "sr.", "ii", "iii", "iv", "md", "phd", "md."}
 
 
+@lru_cache(maxsize=8192)
 def extract_name_pair(full_name: str) -> tuple[str, str] | None:
     """Extract (firstname, lastname) from a full name, ignoring middle names and suffixes.
 
@@ -87,13 +171,28 @@ def extract_name_pair(full_name: str) -> tuple[str, str] | None:
     return (firstname, lastname)
 
 
-@dataclass
+def _first_name_pattern(search_first: str) -> re.Pattern:
+    """Compile a pattern matching the paper first names that fit a search first name.
+
+    First names match if:
+        1. Exact match (glennis == glennis)
+        2. Paper has initial, search has full name (g == glennis[0])
+        3. Search has initial, paper has full name (glennis starts with g)
+    """
+    if len(search_first) == 1:
+        return re.compile(re.escape(search_first) + ".*", re.DOTALL)
+    return re.compile(f"{re.escape(search_first)}|{re.escape(search_first[:1])}")
+
+
+@dataclass(slots=True)
 class EmbeddingFilterResult:
     """Result of filtering a paper using embeddings."""
     paper: Paper
     matched_topics: list[str]
     matched_authors: list[str]
     topic_scores: dict[str, float]
+    # Normalized abstract embedding, when topics were scored
+    abstract_embedding: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
     @property
     def is_matched(self) -> bool:
@@ -120,6 +219,11 @@ class EmbeddingPaperFilter:
         keywords: KeywordsConfig,
         model_name: str = "all-MiniLM-L6-v2",
         similarity_threshold: float = 0.4,
+        quantize: bool = False,
+        device: Optional[str] = None,
+        backend: Optional[str] = None,
+        cache_path: Optional[str] = None,
+        batch_size: int = 64,
     ):
         """Initialize embedding-based paper filter.
 
@@ -127,99 +231,230 @@ class EmbeddingPaperFilter:
             keywords: Keywords configuration with topics and authors.
             model_name: Name of the sentence-transformers model to use.
             similarity_threshold: Minimum cosine similarity to consider a match.
+            quantize: Score with int8 embeddings using SimSIMD. Scores can
+                differ from the float scores by about 0.01. Requires simsimd.
+            device: Device to run the model on. If None, uses EMBEDDING_DEVICE
+                or the best available device (cuda, mps, cpu).
+            backend: sentence-transformers backend ("torch", "onnx" or
+                "openvino"). If None, uses EMBEDDING_BACKEND or "torch".
+            cache_path: Optional SQLite file caching paper embeddings across
+                runs. If None, every paper is encoded.
+            batch_size: Number of texts per forward pass of the model.
         """
         self.topics = keywords.topics
         self.authors = keywords.authors
         self.similarity_threshold = similarity_threshold
+        self.batch_size = batch_size
+
+        # (author, lastname, first-name pattern) for each search author, parsed once
+        self._search_pairs = []
+        for author in self.authors:
+            search_pair = extract_name_pair(author)
+            if search_pair:
+                search_first, search_last = search_pair
+                self._search_pairs.append(
+                    (author, search_last, _first_name_pattern(search_first))
+                )
+
+        if quantize and simsimd is None:
+            print("  simsimd is not installed; scoring with float embeddings")
+            quantize = False
 
         # Load the embedding model
-        print(f"  Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        device = select_device(device)
+        if device == "cpu":
+            torch.set_num_threads(default_num_threads())
+
+        backend = backend or os.environ.get("EMBEDDING_BACKEND", "torch")
+        model_kwargs = {"device": device}
+        if backend != "torch":
+            # Only passed when needed; older sentence-transformers lack it
+            model_kwargs["backend"] = backend
+
+        print(f"  Loading embedding model: {model_name} ({device}, {backend})...")
+        self.model = SentenceTransformer(model_name, **model_kwargs)
 
-        # Pre-compute topic embeddings
+        # Pre-compute topic embeddings (unit length, so a dot product is the cosine)
         if self.topics:
             self.topic_embeddings = self.model.encode(
                 self.topics,
                 convert_to_tensor=True,
+                normalize_embeddings=True,
             )
         else:
             self.topic_embeddings = None
 
-    def filter_paper(self, paper: Paper) -> EmbeddingFilterResult:
-        """Filter a single paper using embedding similarity.
+        # int8 copy of the topic embeddings, only used when quantizing
+        if quantize and self.topic_embeddings is not None:
+            self.topic_embeddings_i8 = quantize_int8(self.topic_embeddings.cpu().numpy())
+        else:
+            self.topic_embeddings_i8 = None
+
+        # Half precision halves matmul bandwidth on GPUs; CPUs stay in float32,
+        # where float16/bfloat16 matmuls are often slower without native support
+        if self.topic_embeddings is not None and self.model.device.type in ("cuda", "mps"):
+            self.topic_embeddings = self.topic_embeddings.half()
+
+        if cache_path:
+            self.cache = EmbeddingCache(cache_path, model_name)
+            self.cache.cleanup_old(days=90)
+        else:
+            self.cache = None
+
+    def _encode(self, texts: list[str]) -> "torch.Tensor":
+        """Encode texts to normalized embeddings, reusing cached ones.
 
         Args:
-            paper: Paper to filter.
+            texts: Texts to encode.
 
         Returns:
-            EmbeddingFilterResult with match information.
+            Tensor of embeddings, one row per text, on the model's device.
         """
-        matched_topics = []
-        matched_authors = []
-        topic_scores = {}
-
-        # Check topics using embedding similarity
-        # Calculate separately for title and abstract, take max score
-        if self.topic_embeddings is not None:
-            title_embedding = self.model.encode(paper.title, convert_to_tensor=True)
-            title_similarities = util.cos_sim(title_embedding, self.topic_embeddings)[0]
-
-            abstract_embedding = self.model.encode(paper.abstract, convert_to_tensor=True)
-            abstract_similarities = util.cos_sim(abstract_embedding, self.topic_embeddings)[0]
-
-            for i, topic in enumerate(self.topics):
-                # Take the maximum score between title and abstract
-                title_score = float(title_similarities[i])
-                abstract_score = float(abstract_similarities[i])
-                score = max(title_score, abstract_score)
-                topic_scores[topic] = score
-                if score >= self.similarity_threshold:
-                    matched_topics.append(topic)
+        if self.cache is None:
+            return self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_tensor=True,
+                show_progress_bar=False,
+                normalize_embeddings=True,
+            )
+
+        cached = self.cache.get_many(texts)
+        uncached_indices = [i for i, vector in enumerate(cached) if vector is None]
+        if uncached_indices:
+            uncached_texts = [texts[i] for i in uncached_indices]
+            new_embeddings = self.model.encode(
+                uncached_texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                normalize_embeddings=True,
+            )
+            self.cache.put_many(uncached_texts, new_embeddings)
+            for i, vector in zip(uncached_indices, new_embeddings):
+                cached[i] = vector
+
+        import torch
+
+        return torch.from_numpy(np.stack(cached).astype(np.float32)).to(self.model.device)
+
+    def _score_topics_batch(
+        self,
+        papers: list[Paper],
+    ) -> tuple[list[dict[str, float]], Optional[np.ndarray]]:
+        """Score papers against all topics with one batched encode call.
+
+        Titles and abstracts are scored separately and the maximum is kept.
+
+        Args:
+            papers: Papers to score.
+
+        Returns:
+            Tuple of (one dict mapping topic to similarity score per paper,
+            float32 abstract embeddings with one row per paper or None when
+            there are no topics).
+        """
+        if self.topic_embeddings is None or not papers:
+            return [{} for _ in papers], None
+
+        # Titles first, then abstracts, so one forward pass covers both
+        texts = [paper.title for paper in papers] + [paper.abstract for paper in papers]
+        embeddings = self._encode(texts)
+        n = len(papers)
+        abstract_embeddings = embeddings[n:].float().cpu().numpy()
+        if self.topic_embeddings_i8 is not None:
+            # cdist returns cosine distances
+            paper_embeddings_i8 = quantize_int8(embeddings.cpu().numpy())
+            similarities = 1.0 - np.asarray(
+                simsimd.cdist(paper_embeddings_i8, self.topic_embeddings_i8, metric="cosine")
+            )
+            # Take the maximum score between title and abstract
+            scores = np.maximum(similarities[:n], similarities[n:]).tolist()
+        else:
+            # Both sides are normalized: one matmul gives every cosine similarity
+            embeddings = embeddings.to(self.topic_embeddings.dtype)
+            similarities = embeddings @ self.topic_embeddings.T
+            # Take the maximum score between title and abstract
+            scores = similarities[:n].maximum(similarities[n:]).tolist()
+        return [dict(zip(self.topics, row)) for row in scores], abstract_embeddings
+
+    def _match_authors(self, paper: Paper) -> list[str]:
+        """Find search authors among the paper's authors.
+
+        Args:
+            paper: Paper to check.
+
+        Returns:
+            Search authors that matched, in config order.
+        """
+        if not self._search_pairs:
+            return []
 
         # Check authors (use normalized ASCII for comparison)
-        # Extract (firstname, lastname) pairs from paper authors
-        paper_author_pairs = []
+        # Index the paper's first names by last name
+        paper_last_index: dict[str, list[str]] = {}
         for author_name in paper.authors:
             pair = extract_name_pair(author_name)
             if pair:
-                paper_author_pairs.append(pair)
+                paper_first, paper_last = pair
+                paper_last_index.setdefault(paper_last, []).append(paper_first)
 
-        for author in self.authors:
-            # Extract first and last name from search author
-            search_pair = extract_name_pair(author)
-            if not search_pair:
-                continue
+        matched_authors = []
+        for author, search_last, first_name_pattern in self._search_pairs:
+            # Last names must match exactly
+            for paper_first in paper_last_index.get(search_last, ()):
+                if first_name_pattern.fullmatch(paper_first):
+                    matched_authors.append(author)
+                    break
 
-            search_first, search_last = search_pair
+        return matched_authors
 
-            # Check each paper author for a match
-            for paper_first, paper_last in paper_author_pairs:
-                # Last names must match exactly
-                if paper_last != search_last:
-                    continue
+    def _build_result(
+        self,
+        paper: Paper,
+        topic_scores: dict[str, float],
+        abstract_embedding: Optional[np.ndarray] = None,
+    ) -> EmbeddingFilterResult:
+        """Combine topic scores and author matches into a filter result.
 
-                # First names match if:
-                # 1. Exact match (glennis == glennis)
-                # 2. Initial match (g == glennis[0] or glennis == g[0])
-                if paper_first == search_first:
-                    matched_authors.append(author)
-                    break
-                elif len(paper_first) == 1 and search_first.startswith(paper_first):
-                    # Paper has initial, search has full name
-                    matched_authors.append(author)
-                    break
-                elif len(search_first) == 1 and paper_first.startswith(search_first):
-                    # Search has initial, paper has full name
-                    matched_authors.append(author)
-                    break
+        Args:
+            paper: Paper that was scored.
+            topic_scores: Similarity score per topic.
+            abstract_embedding: Normalized abstract embedding, if computed.
 
+        Returns:
+            EmbeddingFilterResult with match information.
+        """
+        matched_topics = [
+            topic for topic, score in topic_scores.items()
+            if score >= self.similarity_threshold
+        ]
         return EmbeddingFilterResult(
             paper=paper,
             matched_topics=matched_topics,
-            matched_authors=matched_authors,
+            matched_authors=self._match_authors(paper),
             topic_scores=topic_scores,
+            abstract_embedding=abstract_embedding,
         )
 
+    def filter_paper(self, paper: Paper) -> EmbeddingFilterResult:
+        """Filter a single paper using embedding similarity.
+
+        Args:
+            paper: Paper to filter.
+
+        Returns:
+            EmbeddingFilterResult with match information.
+        """
+        if not self.topics and not self.authors:
+            return EmbeddingFilterResult(paper, [], [], {})
+        all_scores, abstract_embeddings = self._score_topics_batch([paper])
+        abstract_embedding = abstract_embeddings[0] if abstract_embeddings is not None else None
+        return self._build_result(paper, all_scores[0], abstract_embedding)
+
     def filter_papers(self, papers: list[Paper]) -> list[EmbeddingFilterResult]:
         """Filter multiple papers.
 
@@ -229,18 +464,32 @@ class EmbeddingPaperFilter:
         Returns:
             List of EmbeddingFilterResults for papers that matched.
         """
+        # Nothing to match against
+        if not self.topics and not self.authors:
+            return []
+
         results = []
-        for paper in papers:
-            result = self.filter_paper(paper)
+        all_scores, abstract_embeddings = self._score_topics_batch(papers)
+        for i, (paper, topic_scores) in enumerate(zip(papers, all_scores)):
+            abstract_embedding = abstract_embeddings[i] if abstract_embeddings is not None else None
+            result = self._build_result(paper, topic_scores, abstract_embedding)
             if result.is_matched:
                 results.append(result)
         return results
 
+    def close(self):
+        """Close the embedding cache, if any."""
+        if self.cache is not None:
+            self.cache.close()
+
 
 def filter_papers_by_embedding(
     papers: list[Paper],
     keywords: KeywordsConfig,
     similarity_threshold: float = 0.4,
+    quantize: bool = False,
+    cache_path: Optional[str] = None,
+    batch_size: int = 64,
 ) -> list[EmbeddingFilterResult]:
     """Convenience function to filter papers using embeddings.
 
@@ -248,6 +497,9 @@ def filter_papers_by_embedding(
         papers: List of papers to filter.
         keywords: Keywords configuration.
         similarity_threshold: Minimum cosine similarity to consider a match.
+        quantize: Score with int8 embeddings using SimSIMD.
+        cache_path: Optional SQLite file caching paper embeddings across runs.
+        batch_size: Number of texts per forward pass of the model.
 
     Returns:
         List of EmbeddingFilterResults for papers that matched.
@@ -255,5 +507,11 @@ def filter_papers_by_embedding(
     paper_filter = EmbeddingPaperFilter(
         keywords,
         similarity_threshold=similarity_threshold,
+        quantize=quantize,
+        cache_path=cache_path,
+        batch_size=batch_size,
     )
-    return paper_filter.filter_papers(papers)
+    try:
+        return paper_filter.filter_papers(papers)
+    finally:
+        paper_filter.close()
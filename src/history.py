@@ -1,9 +1,17 @@
 """Track notified papers to prevent duplicate notifications."""
 
 import json
-from datetime import datetime, timedelta
+import os
+from datetime import date, timedelta
 from pathlib import Path
 
+from . import jsonutil
+
+
+def _date_to_int(d: date) -> int:
+    """Encode a date as a YYYYMMDD integer, which sorts like the date."""
+    return d.year * 10000 + d.month * 100 + d.day
+
 
 class NotificationHistory:
     """Track which papers have been notified to prevent duplicates."""
@@ -15,23 +23,35 @@ class NotificationHistory:
             history_file: Path to the JSON file storing notified paper IDs.
         """
         self.history_file = Path(history_file)
-        self.notified: dict[str, str] = {}  # paper_id -> notification_date
+        self.notified: dict[str, int] = {}  # paper_id -> notification date (YYYYMMDD)
         self._load()
 
     def _load(self) -> None:
         """Load history from file."""
         if self.history_file.exists():
             try:
-                with open(self.history_file) as f:
-                    self.notified = json.load(f)
+                with open(self.history_file, "rb") as f:
+                    self.notified = jsonutil.loads(f.read())
             except (json.JSONDecodeError, IOError):
                 self.notified = {}
 
+            # Migrate entries written as "YYYY-MM-DD" strings
+            for paper_id, notified_date in self.notified.items():
+                if isinstance(notified_date, str):
+                    self.notified[paper_id] = int(notified_date.replace("-", ""))
+
     def save(self) -> None:
-        """Save history to file."""
+        """Save history to file.
+
+        Writes to a temporary file and renames it over the old one, so a
+        crash mid-write never leaves a truncated history behind.
+        """
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.history_file, "w") as f:
-            json.dump(self.notified, f, indent=2, sort_keys=True)
+        tmp_path = self.history_file.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            # One sorted entry per line keeps the committed file diffable
+            f.write(jsonutil.dumps(self.notified, sort_keys=True, indent=True))
+        os.replace(tmp_path, self.history_file)
 
     def is_notified(self, paper_id: str) -> bool:
         """Check if a paper has already been notified.
@@ -50,7 +70,7 @@ class NotificationHistory:
         Args:
             paper_ids: List of paper IDs to mark as notified.
         """
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _date_to_int(date.today())
         for paper_id in paper_ids:
             self.notified[paper_id] = today
 
@@ -63,13 +83,12 @@ class NotificationHistory:
         Returns:
             Number of entries removed.
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        cutoff_str = cutoff.strftime("%Y-%m-%d")
+        cutoff = _date_to_int(date.today() - timedelta(days=days))
 
         old_count = len(self.notified)
         self.notified = {
             k: v for k, v in self.notified.items()
-            if v >= cutoff_str
+            if v >= cutoff
         }
         return old_count - len(self.notified)
 
@@ -82,4 +101,5 @@ class NotificationHistory:
         Returns:
             List of papers that haven't been notified yet.
         """
-        return [p for p in papers if not self.is_notified(p.pmid)]
+        notified = self.notified
+        return [p for p in papers if p.pmid not in notified]
@@ -0,0 +1,53 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Raw JSON, preferably bytes (e.g. httpx response.content).
+
+    Returns:
+        Parsed JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON.
+
+    Both backends produce the same bytes for dicts, lists, strings and
+    integers, so files written with either one diff cleanly.
+
+    Args:
+        data: Value to serialize.
+        sort_keys: Sort object keys.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
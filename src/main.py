@@ -3,10 +3,13 @@
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import httpx
+
 from .config import load_config, Config
-from .fetchers import PubMedFetcher, BioRxivFetcher
+from .fetchers import PubMedFetcher, BioRxivFetcher, create_shared_client
 from .fetchers.pubmed import Paper
 from .filter_embedding import filter_papers_by_embedding
 from .history import NotificationHistory
@@ -14,9 +17,31 @@ from .summarizer import summarize_papers
 from .notifier import send_to_slack
 
 
+def _fetch_pubmed(config: Config, client: httpx.Client) -> list[Paper]:
+    """Fetch papers from the configured PubMed journals."""
+    with PubMedFetcher(api_key=config.pubmed_api_key, client=client) as fetcher:
+        return fetcher.fetch_papers(
+            journals=config.journals.pubmed,
+            days_back=config.search.days_back,
+        )
+
+
+def _fetch_preprints(config: Config, client: httpx.Client) -> list[Paper]:
+    """Fetch preprints from the configured bioRxiv/medRxiv servers."""
+    with BioRxivFetcher(client=client) as fetcher:
+        return fetcher.fetch_all_preprints(
+            servers=config.journals.preprint,
+            days_back=config.search.days_back,
+            categories_by_server=config.journals.preprint_categories,
+        )
+
+
 def fetch_all_papers(config: Config) -> list[Paper]:
     """Fetch papers from all configured sources.
 
+    The sources are independent and network-bound, so they are fetched
+    concurrently.
+
     Args:
         config: Configuration object.
 
@@ -24,28 +49,28 @@ def fetch_all_papers(config: Config) -> list[Paper]:
         List of all fetched papers.
     """
     all_papers = []
-    days_back = config.search.days_back
 
-    # Fetch from PubMed
     if config.journals.pubmed:
         print(f"Fetching papers from PubMed ({len(config.journals.pubmed)} journals)...")
-        with PubMedFetcher(api_key=config.pubmed_api_key) as fetcher:
-            papers = fetcher.fetch_papers(
-                journals=config.journals.pubmed,
-                days_back=days_back,
-            )
+    if config.journals.preprint:
+        print(f"Fetching preprints ({', '.join(config.journals.preprint)})...")
+
+    # One connection pool for all sources
+    with create_shared_client() as client, ThreadPoolExecutor(max_workers=2) as executor:
+        pubmed_future = None
+        preprint_future = None
+        if config.journals.pubmed:
+            pubmed_future = executor.submit(_fetch_pubmed, config, client)
+        if config.journals.preprint:
+            preprint_future = executor.submit(_fetch_preprints, config, client)
+
+        if pubmed_future is not None:
+            papers = pubmed_future.result()
             print(f"  Found {len(papers)} papers from PubMed")
             all_papers.extend(papers)
 
-    # Fetch from bioRxiv/medRxiv
-    if config.journals.preprint:
-        print(f"Fetching preprints ({', '.join(config.journals.preprint)})...")
-        with BioRxivFetcher() as fetcher:
-            papers = fetcher.fetch_all_preprints(
-                servers=config.journals.preprint,
-                days_back=days_back,
-                categories_by_server=config.journals.preprint_categories,
-            )
+        if preprint_future is not None:
+            papers = preprint_future.result()
             print(f"  Found {len(papers)} preprints")
             all_papers.extend(papers)
 
@@ -56,6 +81,9 @@ def run(
     config_path: str = None,
     dry_run: bool = False,
     history_file: str = "notified_papers.json",
+    embedding_cache: str | None = ".cache/embeddings.sqlite",
+    batch_summaries: bool = False,
+    summary_cache: str | None = ".cache/summaries.sqlite",
 ) -> int:
     """Run the paper notification pipeline.
 
@@ -63,6 +91,9 @@ def run(
         config_path: Path to config file (optional).
         dry_run: If True, don't send to Slack, just print results.
         history_file: Path to file tracking notified papers.
+        embedding_cache: Path to the paper embedding cache (None to disable).
+        batch_summaries: If True, summarize through the Message Batches API.
+        summary_cache: Path to the summary cache (None to disable).
 
     Returns:
         Exit code (0 for success).
@@ -111,7 +142,11 @@ def run(
 
     # Filter papers
     print("\n[3/5] Filtering papers...")
-    filtered = filter_papers_by_embedding(papers, config.keywords)
+    filtered = filter_papers_by_embedding(
+        papers,
+        config.keywords,
+        cache_path=embedding_cache,
+    )
     print(f"  Matched papers: {len(filtered)}")
 
     # Filter out already notified papers
@@ -154,7 +189,12 @@ def run(
             for r in filtered
         ]
     else:
-        summarized = summarize_papers(filtered, config.anthropic_api_key)
+        summarized = summarize_papers(
+            filtered,
+            config.anthropic_api_key,
+            use_batch=batch_summaries,
+            cache_path=summary_cache,
+        )
     print(f"  Summarized {len(summarized)} papers")
 
     # Send to Slack
@@ -214,6 +254,26 @@ def main():
         default="notified_papers.json",
         help="Path to file tracking notified papers (default: notified_papers.json)",
     )
+    parser.add_argument(
+        "--embedding-cache",
+        type=str,
+        default=".cache/embeddings.sqlite",
+        help="Path to the paper embedding cache, or '' to disable "
+             "(default: .cache/embeddings.sqlite)",
+    )
+    parser.add_argument(
+        "--batch-summaries",
+        action="store_true",
+        help="Summarize through the Message Batches API (about half the cost, "
+             "but results can take minutes; not available on Bedrock)",
+    )
+    parser.add_argument(
+        "--summary-cache",
+        type=str,
+        default=".cache/summaries.sqlite",
+        help="Path to the summary cache, or '' to disable "
+             "(default: .cache/summaries.sqlite)",
+    )
 
     args = parser.parse_args()
 
@@ -221,6 +281,9 @@ def main():
         config_path=args.config,
         dry_run=args.dry_run,
         history_file=args.history_file,
+        embedding_cache=args.embedding_cache or None,
+        batch_summaries=args.batch_summaries,
+        summary_cache=args.summary_cache or None,
     ))
 
 
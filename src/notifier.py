@@ -1,5 +1,6 @@
 """Slack notification module using Slack SDK."""
 
+import json
 import time
 from datetime import datetime
 
@@ -8,6 +9,13 @@ from slack_sdk.errors import SlackApiError
 
 from .summarizer import SummarizedPaper
 
+# Slack allows at most 50 blocks per message
+MAX_BLOCKS_PER_MESSAGE = 50
+
+# Slack truncates messages longer than 40,000 characters; counting serialized
+# blocks overestimates the message text, which leaves headroom
+MAX_CHARS_PER_MESSAGE = 40000
+
 
 class SlackNotifier:
     """Send paper notifications to Slack."""
@@ -146,7 +154,8 @@ class SlackNotifier:
     ) -> bool:
         """Send papers to Slack.
 
-        Each paper is sent as a separate message to avoid Slack's text limits.
+        The header and each paper's EN and JA blocks are packed into as few
+        messages as Slack's block and size limits allow.
 
         Args:
             papers: List of summarized papers to send.
@@ -162,21 +171,50 @@ class SlackNotifier:
             blocks = self._create_no_papers_message()
             return self._send_blocks(blocks)
 
-        # Send header message first
-        header_blocks = self._create_header_block(len(papers))
-        if not self._send_blocks(header_blocks):
-            return False
-
-        # Send each paper as separate messages (EN and JA) to avoid text length limits
+        # Header first, then EN and JA blocks of each paper, never split apart
+        units = [self._create_header_block(len(papers))]
         for paper in papers:
-            blocks_en, blocks_ja = self._format_paper_blocks(paper)
-            if not self._send_blocks(blocks_en):
-                return False
-            if not self._send_blocks(blocks_ja):
+            units.extend(self._format_paper_blocks(paper))
+
+        for blocks in self._pack_messages(units):
+            if not self._send_blocks(blocks):
                 return False
 
         return True
 
+    @staticmethod
+    def _pack_messages(units: list[list[dict]]) -> list[list[dict]]:
+        """Pack groups of blocks into messages within Slack's limits.
+
+        Groups are kept whole and in order; a group that is too large on its
+        own is sent as a message by itself.
+
+        Args:
+            units: Groups of blocks that must stay in the same message.
+
+        Returns:
+            List of block lists, one per message.
+        """
+        messages = []
+        current: list[dict] = []
+        current_chars = 0
+
+        for unit in units:
+            unit_chars = sum(len(json.dumps(block, ensure_ascii=False)) for block in unit)
+            if current and (
+                len(current) + len(unit) > MAX_BLOCKS_PER_MESSAGE
+                or current_chars + unit_chars > MAX_CHARS_PER_MESSAGE
+            ):
+                messages.append(current)
+                current = []
+                current_chars = 0
+            current.extend(unit)
+            current_chars += unit_chars
+
+        if current:
+            messages.append(current)
+        return messages
+
     def _send_blocks(self, blocks: list[dict], max_retries: int = 3) -> bool:
         """Send blocks to Slack with rate limit handling.
 
@@ -1,19 +1,73 @@
 """Paper summarizer using Claude API."""
 
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import anthropic
+import numpy as np
 
 from .fetchers.pubmed import Paper
 from .filter import FilterResult
+from .summary_cache import SummaryCache
+
+
+# Errors are logged rather than printed: worker threads would otherwise
+# contend on stdout, and failures carry a traceback
+logger = logging.getLogger(__name__)
 
 
 # Default models for each backend
 DEFAULT_MODEL_DIRECT = "claude-opus-4-5-20251101"
 DEFAULT_MODEL_BEDROCK = "global.anthropic.claude-opus-4-5-20251101-v1:0"
 
+# Attempts after the first for transient API errors (SDK default: 2)
+MAX_RETRIES = 5
+
+# The SDK only retries opening a stream; errors arriving mid-stream (as SSE
+# error events) are retried this many times, with exponential backoff from
+# STREAM_RETRY_DELAY seconds
+STREAM_RETRIES = 3
+STREAM_RETRY_DELAY = 2.0
+
+# Status codes and (mid-stream) error types worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+RETRYABLE_ERROR_TYPES = frozenset({"overloaded_error", "api_error", "rate_limit_error"})
+
+# Output cap for a summary: two sections of up to 2800 characters each, where
+# the Japanese one alone can take close to one token per character
+MAX_OUTPUT_TOKENS = 4000
+
+# Marker the model writes after the Japanese section; used as a stop sequence
+END_MARKER = "=== END ==="
+
+# Stop reasons of a finished summary; anything else (e.g. "max_tokens") means
+# the response was cut off and is not cached
+COMPLETE_STOP_REASONS = ("stop_sequence", "end_turn")
+
+# Abstracts at least this similar reuse each other's cached summaries
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Shorter abstracts (or missing ones) embed too generically to compare
+SEMANTIC_CACHE_MIN_ABSTRACT_CHARS = 200
+
+
+# Per-paper request; filled with title, authors, journal and abstract
+USER_PROMPT_TEMPLATE = """Please summarize the following paper in both English and Japanese.
+
+Title: %s
+
+Authors: %s
+
+Journal: %s
+
+Abstract:
+%s"""
+
 
 def create_client(api_key: Optional[str] = None) -> tuple[anthropic.Anthropic, str]:
     """Create appropriate Anthropic client based on environment.
@@ -25,14 +79,44 @@ def create_client(api_key: Optional[str] = None) -> tuple[anthropic.Anthropic, s
         Tuple of (client, default_model).
     """
     use_bedrock = os.environ.get("USE_BEDROCK", "").lower() in ("1", "true", "yes")
+    return _cached_client(use_bedrock, api_key)
+
 
+@lru_cache(maxsize=None)
+def _cached_client(use_bedrock: bool, api_key: Optional[str]) -> tuple[anthropic.Anthropic, str]:
+    """Create a client once per backend and key, so its connection pool is reused."""
+    # The SDK retries connection errors, 408/409/429 and 5xx responses with
+    # exponential backoff and jitter; other 4xx errors fail immediately
     if use_bedrock:
-        return anthropic.AnthropicBedrock(), DEFAULT_MODEL_BEDROCK
+        return anthropic.AnthropicBedrock(max_retries=MAX_RETRIES), DEFAULT_MODEL_BEDROCK
     else:
-        return anthropic.Anthropic(api_key=api_key), DEFAULT_MODEL_DIRECT
+        return anthropic.Anthropic(api_key=api_key, max_retries=MAX_RETRIES), DEFAULT_MODEL_DIRECT
 
 
-@dataclass
+def _is_retryable(error: Exception) -> bool:
+    """Check whether an API error is transient.
+
+    Mid-stream errors arrive with the stream's 200 status, so their error
+    type is checked as well.
+
+    Args:
+        error: Exception raised by the client.
+
+    Returns:
+        True if the request is worth retrying.
+    """
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if not isinstance(error, anthropic.APIStatusError):
+        return False
+    if error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500:
+        return True
+    body = error.body if isinstance(error.body, dict) else {}
+    details = body.get("error")
+    return isinstance(details, dict) and details.get("type") in RETRYABLE_ERROR_TYPES
+
+
+@dataclass(slots=True, frozen=True)
 class SummarizedPaper:
     """Paper with English and Japanese summaries."""
     paper: Paper
@@ -93,49 +177,150 @@ Claudeによる簡潔な分析：
 - 科学的・社会的インパクトの可能性
 - 今後の展望
 
-専門用語は適切に日本語に訳すか、英語のまま残してください。"""
+専門用語は適切に日本語に訳すか、英語のまま残してください。
+
+When you have finished the Japanese section, write "=== END ===" on its own line and stop."""
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        cache_path: Optional[str] = None,
+    ):
         """Initialize summarizer.
 
         Args:
             api_key: Anthropic API key (not needed for Bedrock).
             model: Model to use for summarization. If None, uses default for backend.
+            cache_path: Optional SQLite file caching summaries across runs.
         """
         self.client, default_model = create_client(api_key)
         self.model = model or default_model
 
-    def summarize_paper(self, paper: Paper) -> tuple[str, str]:
-        """Summarize a single paper.
+        if cache_path:
+            self.cache = SummaryCache(cache_path)
+            self.cache.cleanup_old()
+        else:
+            self.cache = None
+
+    def _cache_key(self, paper: Paper) -> str:
+        """Cache key of a paper's summaries for this model."""
+        return SummaryCache.make_key(self.model, paper.pmid, paper.abstract)
+
+    @staticmethod
+    def _semantic_embedding(
+        paper: Paper,
+        abstract_embedding: Optional[np.ndarray],
+    ) -> Optional[np.ndarray]:
+        """Return the abstract embedding if it is usable for semantic lookups."""
+        if abstract_embedding is None or len(paper.abstract) < SEMANTIC_CACHE_MIN_ABSTRACT_CHARS:
+            return None
+        return abstract_embedding
+
+    def _lookup_cache(
+        self,
+        paper: Paper,
+        abstract_embedding: Optional[np.ndarray] = None,
+    ) -> Optional[tuple[str, str]]:
+        """Find cached summaries of the paper or of a near-duplicate abstract.
 
         Args:
             paper: Paper to summarize.
+            abstract_embedding: Normalized abstract embedding, if available.
 
         Returns:
-            Tuple of (English summary, Japanese summary).
+            Tuple of (English summary, Japanese summary), or None on a miss.
         """
-        user_prompt = f"""Please summarize the following paper in both English and Japanese.
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self._cache_key(paper))
+        if cached is None:
+            embedding = self._semantic_embedding(paper, abstract_embedding)
+            if embedding is not None:
+                cached = self.cache.find_similar(
+                    embedding, self.model, SEMANTIC_CACHE_THRESHOLD
+                )
+        return cached
 
-Title: {paper.title}
+    def _store_summary(
+        self,
+        paper: Paper,
+        full_response: str,
+        stop_reason: Optional[str],
+        abstract_embedding: Optional[np.ndarray] = None,
+    ) -> tuple[str, str]:
+        """Split a model response and cache it if it is complete.
 
-Authors: {', '.join(paper.authors[:5])}{'...' if len(paper.authors) > 5 else ''}
+        Args:
+            paper: Paper that was summarized.
+            full_response: Text returned by the model.
+            stop_reason: Why generation stopped, from the API response.
+            abstract_embedding: Normalized abstract embedding, if available.
 
-Journal: {paper.journal}
+        Returns:
+            Tuple of (English summary, Japanese summary).
+        """
+        summary_en, summary_ja = self._split_summary(full_response)
+        # Truncated responses and ones missing the Japanese part are retried
+        # next run
+        if (
+            self.cache is not None
+            and stop_reason in COMPLETE_STOP_REASONS
+            and "---JAPANESE---" in full_response
+        ):
+            self.cache.put(
+                self._cache_key(paper),
+                summary_en,
+                summary_ja,
+                self.model,
+                embedding=self._semantic_embedding(paper, abstract_embedding),
+            )
+        return summary_en, summary_ja
 
-Abstract:
-{paper.abstract}"""
+    def _build_request(self, paper: Paper) -> dict:
+        """Build the Messages API parameters for summarizing a paper.
+
+        Args:
+            paper: Paper to summarize.
 
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=5000,
-            system=self.SYSTEM_PROMPT,
-            messages=[
+        Returns:
+            Keyword arguments for messages.create.
+        """
+        user_prompt = USER_PROMPT_TEMPLATE % (
+            paper.title,
+            paper.author_head,
+            paper.journal,
+            paper.abstract,
+        )
+
+        return {
+            "model": self.model,
+            "max_tokens": MAX_OUTPUT_TOKENS,
+            # Ends generation right after the Japanese section
+            "stop_sequences": [END_MARKER],
+            # Identical for every paper, so mark it as a cacheable prefix
+            "system": [
+                {
+                    "type": "text",
+                    "text": self.SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                },
+            ],
+            "messages": [
                 {"role": "user", "content": user_prompt}
             ],
-        )
+        }
+
+    @staticmethod
+    def _split_summary(full_response: str) -> tuple[str, str]:
+        """Split a model response into English and Japanese summaries.
 
-        full_response = message.content[0].text
+        Args:
+            full_response: Text returned by the model.
 
+        Returns:
+            Tuple of (English summary, Japanese summary).
+        """
         # Split response into English and Japanese parts
         if "---JAPANESE---" in full_response:
             parts = full_response.split("---JAPANESE---", 1)
@@ -148,50 +333,204 @@ Abstract:
 
         return summary_en, summary_ja
 
+    def summarize_paper(
+        self,
+        paper: Paper,
+        abstract_embedding: Optional[np.ndarray] = None,
+    ) -> tuple[str, str]:
+        """Summarize a single paper.
+
+        Args:
+            paper: Paper to summarize.
+            abstract_embedding: Normalized abstract embedding (from the
+                embedding filter); enables reuse of near-duplicate summaries.
+
+        Returns:
+            Tuple of (English summary, Japanese summary).
+        """
+        cached = self._lookup_cache(paper, abstract_embedding)
+        if cached is not None:
+            return cached
+
+        request = self._build_request(paper)
+        for attempt in range(STREAM_RETRIES + 1):
+            try:
+                # Streaming keeps the connection active during long generations
+                # instead of waiting on a single buffered response
+                with self.client.messages.stream(**request) as stream:
+                    full_response = "".join(stream.text_stream)
+                    stop_reason = stream.get_final_message().stop_reason
+                break
+            except anthropic.APIError as e:
+                if attempt == STREAM_RETRIES or not _is_retryable(e):
+                    raise
+                delay = STREAM_RETRY_DELAY * 2 ** attempt
+                logger.warning(
+                    "Retrying paper %s in %.0f s after API error: %s", paper.pmid, delay, e
+                )
+                time.sleep(delay)
+        return self._store_summary(paper, full_response, stop_reason, abstract_embedding)
+
+    def _summarize_result(self, result: FilterResult) -> SummarizedPaper:
+        """Summarize one filtered paper, falling back to a placeholder on error.
+
+        Args:
+            result: Filtered paper to summarize.
+
+        Returns:
+            SummarizedPaper object.
+        """
+        try:
+            summary_en, summary_ja = self.summarize_paper(
+                result.paper,
+                getattr(result, "abstract_embedding", None),
+            )
+            return SummarizedPaper(
+                paper=result.paper,
+                summary_en=summary_en,
+                summary_ja=summary_ja,
+                match_reason=result.match_reason,
+            )
+        except Exception:
+            logger.exception("Error summarizing paper %s", result.paper.pmid)
+            # Include paper without summary
+            return SummarizedPaper(
+                paper=result.paper,
+                summary_en="(Failed to generate summary)",
+                summary_ja="(要約の生成に失敗しました)",
+                match_reason=result.match_reason,
+            )
+
     def summarize_papers(
         self,
         filter_results: list[FilterResult],
+        max_concurrency: int = 4,
     ) -> list[SummarizedPaper]:
         """Summarize multiple papers.
 
+        Requests are independent and network-bound, so up to max_concurrency
+        of them run at once on the (thread-safe) client.
+
         Args:
             filter_results: List of filtered papers to summarize.
+            max_concurrency: Maximum number of requests in flight.
 
         Returns:
-            List of SummarizedPaper objects.
+            List of SummarizedPaper objects, in the order of filter_results.
         """
-        summarized = []
+        if len(filter_results) <= 1 or max_concurrency <= 1:
+            return [self._summarize_result(result) for result in filter_results]
 
-        for result in filter_results:
-            try:
-                summary_en, summary_ja = self.summarize_paper(result.paper)
-                summarized.append(
-                    SummarizedPaper(
-                        paper=result.paper,
-                        summary_en=summary_en,
-                        summary_ja=summary_ja,
-                        match_reason=result.match_reason,
-                    )
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self._summarize_result, filter_results))
+
+    def summarize_papers_batch(
+        self,
+        filter_results: list[FilterResult],
+        poll_interval: float = 30.0,
+        max_wait: float = 3600.0,
+    ) -> list[SummarizedPaper]:
+        """Summarize multiple papers through the Message Batches API.
+
+        Batches cost about half as much as individual requests but can take
+        a while to finish. Bedrock clients do not support the Batches API, and
+        batches that do not finish within max_wait are canceled; both cases
+        fall back to summarize_papers.
+
+        Args:
+            filter_results: List of filtered papers to summarize.
+            poll_interval: Seconds between batch status checks.
+            max_wait: Maximum seconds to wait for the batch to finish.
+
+        Returns:
+            List of SummarizedPaper objects, in the order of filter_results.
+        """
+        if not filter_results:
+            return []
+        if isinstance(self.client, anthropic.AnthropicBedrock):
+            print("  Message Batches API is not available on Bedrock; sending requests directly")
+            return self.summarize_papers(filter_results)
+
+        # Only papers without cached summaries go into the batch
+        summaries = {}
+        if self.cache is not None:
+            for i, result in enumerate(filter_results):
+                cached = self._lookup_cache(
+                    result.paper,
+                    getattr(result, "abstract_embedding", None),
                 )
-            except Exception as e:
-                print(f"Error summarizing paper {result.paper.pmid}: {e}")
-                # Include paper without summary
-                summarized.append(
-                    SummarizedPaper(
-                        paper=result.paper,
-                        summary_en="(Failed to generate summary)",
-                        summary_ja="(要約の生成に失敗しました)",
-                        match_reason=result.match_reason,
+                if cached is not None:
+                    summaries[i] = cached
+        pending = [i for i in range(len(filter_results)) if i not in summaries]
+
+        if pending:
+            # custom_id only allows [a-zA-Z0-9_-], which DOI-based IDs can violate
+            batch = self.client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": f"paper-{i}",
+                        "params": self._build_request(filter_results[i].paper),
+                    }
+                    for i in pending
+                ],
+            )
+            print(f"  Submitted batch {batch.id} ({len(pending)} papers)")
+
+            deadline = time.monotonic() + max_wait
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    print(f"  Batch {batch.id} did not finish in time; sending requests directly")
+                    self.client.messages.batches.cancel(batch.id)
+                    return self.summarize_papers(filter_results)
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                index = int(entry.custom_id.removeprefix("paper-"))
+                paper = filter_results[index].paper
+                if entry.result.type == "succeeded":
+                    summaries[index] = self._store_summary(
+                        paper,
+                        entry.result.message.content[0].text,
+                        entry.result.message.stop_reason,
+                        getattr(filter_results[index], "abstract_embedding", None),
+                    )
+                else:
+                    logger.error(
+                        "Error summarizing paper %s: batch request %s",
+                        paper.pmid,
+                        entry.result.type,
                     )
-                )
 
+        summarized = []
+        for i, result in enumerate(filter_results):
+            summary_en, summary_ja = summaries.get(
+                i,
+                ("(Failed to generate summary)", "(要約の生成に失敗しました)"),
+            )
+            summarized.append(
+                SummarizedPaper(
+                    paper=result.paper,
+                    summary_en=summary_en,
+                    summary_ja=summary_ja,
+                    match_reason=result.match_reason,
+                )
+            )
         return summarized
 
+    def close(self):
+        """Close the summary cache, if any."""
+        if self.cache is not None:
+            self.cache.close()
+
 
 def summarize_papers(
     filter_results: list[FilterResult],
     api_key: Optional[str] = None,
     model: Optional[str] = None,
+    max_concurrency: int = 4,
+    use_batch: bool = False,
+    cache_path: Optional[str] = None,
 ) -> list[SummarizedPaper]:
     """Convenience function to summarize papers.
 
@@ -199,9 +538,17 @@ def summarize_papers(
         filter_results: List of filtered papers.
         api_key: Anthropic API key (not needed for Bedrock).
         model: Model to use. If None, uses default for backend.
+        max_concurrency: Maximum number of requests in flight.
+        use_batch: Submit all papers as one Message Batch (cheaper, slower).
+        cache_path: Optional SQLite file caching summaries across runs.
 
     Returns:
         List of SummarizedPaper objects.
     """
-    summarizer = PaperSummarizer(api_key=api_key, model=model)
-    return summarizer.summarize_papers(filter_results)
+    summarizer = PaperSummarizer(api_key=api_key, model=model, cache_path=cache_path)
+    try:
+        if use_batch:
+            return summarizer.summarize_papers_batch(filter_results)
+        return summarizer.summarize_papers(filter_results, max_concurrency=max_concurrency)
+    finally:
+        summarizer.close()
@@ -0,0 +1,191 @@
+"""Persistent cache of paper summaries."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class SummaryCache:
+    """SQLite-backed cache mapping (model, paper, abstract) to its summaries.
+
+    Papers reappear across runs (overlapping PubMed windows, re-runs after a
+    failed Slack post), and a cache hit saves a full API call. Entries can
+    also store the abstract embedding, so near-duplicate abstracts (e.g. a
+    preprint and its journal version) can reuse a summary written by the same
+    model. The connection is shared by the summarizer's worker threads, so
+    access is serialized.
+    """
+
+    def __init__(self, cache_path: str | Path, max_age_days: int = 30):
+        """Open (or create) the cache.
+
+        Args:
+            cache_path: Path to the SQLite database file.
+            max_age_days: Entries older than this are treated as missing.
+        """
+        self.cache_path = Path(cache_path)
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        # (model, embedding size) -> (keys, embedding matrix) of fresh entries,
+        # loaded on first lookup; sizes differ only if the embedding model changed
+        self._embeddings: Optional[dict[tuple[str, int], tuple[list[str], np.ndarray]]] = None
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                key TEXT PRIMARY KEY,
+                summary_en TEXT NOT NULL,
+                summary_ja TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summary_embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vec BLOB NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    def make_key(model: str, pmid: str, abstract: str) -> str:
+        """Build the cache key for a paper summarized by a model.
+
+        Args:
+            model: Model name.
+            pmid: Paper identifier.
+            abstract: Paper abstract; a revised abstract gets a new summary.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        data = f"{model}|{pmid}|{abstract}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        """Look up cached summaries.
+
+        Args:
+            key: Key from make_key.
+
+        Returns:
+            Tuple of (English summary, Japanese summary), or None if missing
+            or expired.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT summary_en, summary_ja FROM summary_cache WHERE key = ? AND created >= ?",
+                (key, time.time() - self.max_age),
+            ).fetchone()
+        return row
+
+    def find_similar(
+        self,
+        embedding: np.ndarray,
+        model: str,
+        threshold: float,
+    ) -> Optional[tuple[str, str]]:
+        """Look up summaries of the most similar cached abstract.
+
+        Only summaries written by the same model are considered. A brute-force
+        dot product is plenty for a cache pruned to max_age_days of papers.
+
+        Args:
+            embedding: Normalized abstract embedding.
+            model: Summarization model name.
+            threshold: Minimum cosine similarity for a hit.
+
+        Returns:
+            Tuple of (English summary, Japanese summary), or None if no cached
+            abstract is similar enough.
+        """
+        with self._lock:
+            if self._embeddings is None:
+                rows = self.conn.execute(
+                    "SELECT e.key, e.model, e.vec FROM summary_embeddings e "
+                    "JOIN summary_cache c ON c.key = e.key WHERE c.created >= ?",
+                    (time.time() - self.max_age,),
+                ).fetchall()
+                groups: dict[tuple[str, int], tuple[list[str], list[np.ndarray]]] = {}
+                for key, entry_model, vec in rows:
+                    vector = np.frombuffer(vec, dtype=np.float16)
+                    keys, vectors = groups.setdefault((entry_model, vector.shape[0]), ([], []))
+                    keys.append(key)
+                    vectors.append(vector)
+                self._embeddings = {
+                    group: (keys, np.stack(vectors).astype(np.float32))
+                    for group, (keys, vectors) in groups.items()
+                }
+            entry = self._embeddings.get((model, embedding.shape[0]))
+
+        if entry is None:
+            return None
+        keys, matrix = entry
+
+        similarities = matrix @ embedding.astype(np.float32)
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        return self.get(keys[best])
+
+    def put(
+        self,
+        key: str,
+        summary_en: str,
+        summary_ja: str,
+        model: str,
+        embedding: Optional[np.ndarray] = None,
+    ):
+        """Store summaries.
+
+        Args:
+            key: Key from make_key.
+            summary_en: English summary.
+            summary_ja: Japanese summary.
+            model: Summarization model name, used to scope find_similar.
+            embedding: Optional normalized abstract embedding for find_similar.
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summary_cache (key, summary_en, summary_ja, created) "
+                "VALUES (?, ?, ?, ?)",
+                (key, summary_en, summary_ja, time.time()),
+            )
+            if embedding is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO summary_embeddings (key, model, vec) VALUES (?, ?, ?)",
+                    (key, model, np.asarray(embedding, dtype=np.float16).tobytes()),
+                )
+                self._embeddings = None
+
+    def cleanup_old(self):
+        """Remove expired entries."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM summary_cache WHERE created < ?",
+                (time.time() - self.max_age,),
+            )
+            self.conn.execute(
+                "DELETE FROM summary_embeddings WHERE key NOT IN (SELECT key FROM summary_cache)"
+            )
+            self._embeddings = None
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
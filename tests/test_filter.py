@@ -0,0 +1,71 @@
+"""Tests for keyword and author matching in src/filter.py."""
+
+import pytest
+
+from src.config import KeywordsConfig
+from src.fetchers.pubmed import Paper
+from src.filter import (
+    PaperBatch,
+    PaperFilter,
+    _AhoCorasickMatcher,
+    _AlternationMatcher,
+    _FindMatcher,
+)
+
+
+def _paper(title: str = "", abstract: str = "", authors: list[str] | None = None) -> Paper:
+    return Paper(
+        pmid="1",
+        title=title,
+        authors=authors or [],
+        abstract=abstract,
+        journal="",
+        pub_date="",
+    )
+
+
+@pytest.mark.parametrize("matcher_cls", [_FindMatcher, _AhoCorasickMatcher, _AlternationMatcher])
+def test_ascii_keyword_respects_unicode_boundaries(matcher_cls):
+    if matcher_cls is _AhoCorasickMatcher:
+        pytest.importorskip("ahocorasick")
+    matcher = matcher_cls(["Li", "ATAC"])
+
+    assert matcher.search("Liñán José, ATACé-seq") == set()
+    assert list(matcher.iter_matches("liñán josé, atacé-seq")) == []
+    assert matcher.search("Li Wei, ATAC-seq") == {"Li", "ATAC"}
+
+
+def test_author_surname_does_not_match_accented_prefix():
+    paper_filter = PaperFilter(KeywordsConfig(topics=[], authors=["Wei Li"]))
+
+    assert not paper_filter.filter_paper(_paper(authors=["Liñán José", "Liú Mei"])).is_matched
+    assert paper_filter.filter_papers([_paper(authors=["Liñán José"])]) == []
+    assert paper_filter.filter_paper(_paper(authors=["Li Wei"])).matched_authors == ["Wei Li"]
+
+
+def test_author_listed_twice_is_reported_once():
+    paper_filter = PaperFilter(KeywordsConfig(topics=[], authors=["Wei Li", "Wei Li"]))
+    paper = _paper(authors=["Wei Li"])
+
+    assert paper_filter.filter_paper(paper).matched_authors == ["Wei Li"]
+    assert paper_filter.filter_papers([paper])[0].matched_authors == ["Wei Li"]
+
+
+@pytest.mark.parametrize("matcher_cls", [_FindMatcher, _AhoCorasickMatcher, _AlternationMatcher])
+def test_filter_batch_agrees_with_filter_paper(matcher_cls):
+    if matcher_cls is _AhoCorasickMatcher:
+        pytest.importorskip("ahocorasick")
+    topics = ["İstanbul", "ATAC", "single-cell", "Σίσυφος", "KRAS"]
+    paper_filter = PaperFilter(KeywordsConfig(topics=topics, authors=["Wei Li"]))
+    paper_filter._topic_matcher = matcher_cls(topics)
+    papers = [
+        _paper(title="Cohort study in İstanbul", abstract="ATAC-seq of KRAS mutants"),
+        _paper(title="İİİ single-cell atlas", abstract="no match here"),
+        _paper(title="ΣΊΣΥΦΟΣ and İstanbul", authors=["Li Wei"]),
+        _paper(title="Unrelated", abstract="İ then kras"),
+        _paper(title="Nothing", abstract="Nothing"),
+    ]
+
+    expected = [paper_filter.filter_paper(paper) for paper in papers]
+    expected = [result for result in expected if result.is_matched]
+    assert paper_filter.filter_batch(PaperBatch.from_papers(papers)) == expected
@@ -0,0 +1,25 @@
+"""Tests for result handling in src/filter_embedding.py."""
+
+import numpy as np
+
+from src.fetchers.pubmed import Paper
+from src.filter_embedding import EmbeddingFilterResult
+
+
+def _result(embedding: np.ndarray) -> EmbeddingFilterResult:
+    paper = Paper(pmid="1", title="Title", authors=[], abstract="Abstract",
+                  journal="Journal", pub_date="2024-01-01")
+    return EmbeddingFilterResult(
+        paper=paper,
+        matched_topics=["ATAC"],
+        matched_authors=[],
+        topic_scores={"ATAC": 0.5},
+        abstract_embedding=embedding,
+    )
+
+
+def test_abstract_embedding_is_left_out_of_eq_and_repr():
+    result = _result(np.ones(384, dtype=np.float32))
+
+    assert result == _result(np.zeros(384, dtype=np.float32))
+    assert "abstract_embedding" not in repr(result)
@@ -0,0 +1,48 @@
+"""Tests for message packing in src/notifier.py."""
+
+from src.fetchers.pubmed import Paper
+from src.notifier import MAX_BLOCKS_PER_MESSAGE, MAX_CHARS_PER_MESSAGE, SlackNotifier
+from src.summarizer import SummarizedPaper
+
+
+def _section(text: str) -> dict:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _summarized(i: int) -> SummarizedPaper:
+    paper = Paper(pmid=str(i), title=f"Paper {i}", authors=["Wei Li"], abstract="",
+                  journal="Journal", pub_date="2024-01-01")
+    return SummarizedPaper(paper=paper, summary_en="e" * 2500, summary_ja="日" * 1500,
+                           match_reason="Topics: ATAC")
+
+
+def test_typical_papers_share_messages():
+    notifier = SlackNotifier.__new__(SlackNotifier)
+    units = [notifier._create_header_block(10)]
+    for i in range(10):
+        units.extend(notifier._format_paper_blocks(_summarized(i)))
+
+    messages = SlackNotifier._pack_messages(units)
+
+    assert len(messages) <= 2
+    assert [block for message in messages for block in message] == [
+        block for unit in units for block in unit
+    ]
+
+
+def test_block_limit_splits_messages():
+    units = [[_section("x"), _section("y")] for _ in range(40)]
+
+    messages = SlackNotifier._pack_messages(units)
+
+    assert [len(message) for message in messages] == [50, 30]
+    assert all(len(message) <= MAX_BLOCKS_PER_MESSAGE for message in messages)
+
+
+def test_size_limit_keeps_groups_whole():
+    big = _section("x" * (MAX_CHARS_PER_MESSAGE // 2))
+    units = [[big], [_section("a"), _section("b")], [big], [_section("x" * MAX_CHARS_PER_MESSAGE)]]
+
+    messages = SlackNotifier._pack_messages(units)
+
+    assert messages == [units[0] + units[1], units[2], units[3]]
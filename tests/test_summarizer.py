@@ -0,0 +1,109 @@
+"""Tests for response handling in src/summarizer.py."""
+
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from src import summarizer
+from src.fetchers.pubmed import Paper
+from src.summarizer import PaperSummarizer
+
+RESPONSE = "English summary\n---JAPANESE---\n日本語の要約"
+
+
+class _FakeStream:
+    def __init__(self, text: str, stop_reason: str, error: Exception | None = None):
+        self.text_stream = self._text(text, error)
+        self._stop_reason = stop_reason
+
+    @staticmethod
+    def _text(text: str, error: Exception | None):
+        yield text[:10]
+        if error is not None:
+            raise error
+        yield text[10:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def get_final_message(self):
+        return SimpleNamespace(stop_reason=self._stop_reason)
+
+
+class _FakeClient:
+    def __init__(self, stop_reason: str, errors: list[Exception] = ()):
+        self.calls = 0
+        self.messages = SimpleNamespace(stream=self._stream)
+        self._stop_reason = stop_reason
+        self._errors = list(errors)
+
+    def _stream(self, **params):
+        self.calls += 1
+        error = self._errors.pop(0) if self._errors else None
+        return _FakeStream(RESPONSE, self._stop_reason, error)
+
+
+def _stream_error(status_code: int, error_type: str) -> anthropic.APIStatusError:
+    response = httpx.Response(
+        status_code, request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    )
+    body = {"type": "error", "error": {"type": error_type, "message": error_type}}
+    return anthropic.APIStatusError(str(body), response=response, body=body)
+
+
+def _summarizer(
+    monkeypatch,
+    tmp_path,
+    stop_reason: str,
+    errors: list[Exception] = (),
+) -> PaperSummarizer:
+    client = _FakeClient(stop_reason, errors)
+    monkeypatch.setattr(summarizer.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(summarizer, "create_client", lambda api_key=None: (client, "model"))
+    return PaperSummarizer(cache_path=str(tmp_path / "summaries.db"))
+
+
+def _paper() -> Paper:
+    return Paper(pmid="1", title="Title", authors=["Wei Li"], abstract="Abstract",
+                 journal="Journal", pub_date="2024-01-01")
+
+
+@pytest.mark.parametrize("stop_reason", ["stop_sequence", "end_turn"])
+def test_complete_response_is_cached(monkeypatch, tmp_path, stop_reason):
+    paper_summarizer = _summarizer(monkeypatch, tmp_path, stop_reason)
+
+    assert paper_summarizer.summarize_paper(_paper()) == ("English summary", "日本語の要約")
+    paper_summarizer.summarize_paper(_paper())
+    assert paper_summarizer.client.calls == 1
+
+
+def test_truncated_response_is_not_cached(monkeypatch, tmp_path):
+    paper_summarizer = _summarizer(monkeypatch, tmp_path, "max_tokens")
+
+    paper_summarizer.summarize_paper(_paper())
+    assert paper_summarizer.cache.get(paper_summarizer._cache_key(_paper())) is None
+    paper_summarizer.summarize_paper(_paper())
+    assert paper_summarizer.client.calls == 2
+
+
+def test_mid_stream_overload_is_retried(monkeypatch, tmp_path):
+    # SSE error events arrive on the stream's 200 response
+    errors = [_stream_error(200, "overloaded_error"), _stream_error(529, "overloaded_error")]
+    paper_summarizer = _summarizer(monkeypatch, tmp_path, "stop_sequence", errors)
+
+    assert paper_summarizer.summarize_paper(_paper()) == ("English summary", "日本語の要約")
+    assert paper_summarizer.client.calls == 3
+
+
+def test_invalid_request_is_not_retried(monkeypatch, tmp_path):
+    errors = [_stream_error(400, "invalid_request_error")]
+    paper_summarizer = _summarizer(monkeypatch, tmp_path, "stop_sequence", errors)
+
+    with pytest.raises(anthropic.APIStatusError):
+        paper_summarizer.summarize_paper(_paper())
+    assert paper_summarizer.client.calls == 1